@@ -1,5 +1,5 @@
 from fastapi import FastAPI, HTTPException, Request, Response, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
@@ -479,7 +479,7 @@ async def get_map_svg(request: Request):
         request: The FastAPI request object
         
     Returns:
-        HTMLResponse: The SVG content
+        Response: The cached SVG content, or a StreamingResponse that streams it as it is generated
         
     Raises:
         HTTPException: If no active session
@@ -499,7 +499,12 @@ async def get_map_svg(request: Request):
         except ValueError:
             print(f"DEBUG: Invalid UUID format for current_room_id: {dungeon.current_room_id}")
     
-    # Generate the SVG representation of the map
-    svg_map = dungeon.map.to_svg(current_room_id=current_room_id)
+    # Serve an unchanged map straight from its render cache
+    cached_svg = dungeon.map.get_cached_svg(current_room_id=current_room_id)
+    if cached_svg is not None:
+        return Response(content=cached_svg, media_type="text/html")
     
-    return HTMLResponse(content=svg_map) 
\ No newline at end of file
+    # Otherwise stream the SVG in coarse chunks as it is generated. Starlette
+    # pulls the iterator from a worker thread, so the map must not be
+    # modified while the response is in flight.
+    return StreamingResponse(dungeon.map.iter_svg(current_room_id=current_room_id), media_type="text/html") 
\ No newline at end of file
@@ -1,12 +1,17 @@
 """AI Generator for the dungeon project."""
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Tuple
 from groq import Groq
 from .ai_prompt import AIPrompt
 
 class AIGenerator:
     """A class for generating content using AI."""
     
+    # Returned when a room description cannot be generated
+    ROOM_FALLBACK_DESCRIPTION = "A mysterious room with stone walls and a dim light source."
+    
     def __init__(self):
         """Initialize the AI Generator."""
         self.client = Groq(
@@ -55,7 +60,7 @@ class AIGenerator:
             
             if not room:
                 print(f"DEBUG: Room with ID {room_id} not found")
-                return "A mysterious room with stone walls and a dim light source."
+                return self.ROOM_FALLBACK_DESCRIPTION
             
             # Create a prompt with room information
             prompt = f'''
@@ -87,7 +92,30 @@ class AIGenerator:
         
         except Exception as e:
             print(f"DEBUG: Error generating room description: {e}")
-            return "A mysterious room with stone walls and a dim light source."
+            return self.ROOM_FALLBACK_DESCRIPTION
+    
+    def room_description_generate_batch(
+        self,
+        rooms: Sequence[Tuple[str, object]],
+        max_workers: int = 8
+    ) -> List[str]:
+        """Generate descriptions for several rooms at once.
+        
+        The chat completions API takes one conversation per request, so the
+        requests are sent concurrently rather than as a single call.
+        
+        Args:
+            rooms: (room_id, room) pairs, as passed to room_description_generate
+            max_workers: The most requests to have in flight at once
+            
+        Returns:
+            The generated descriptions, in the same order as rooms
+        """
+        if not rooms:
+            return []
+        room_ids, room_objs = zip(*rooms)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.room_description_generate, room_ids, room_objs))
     
     def npc_description_generate(self) -> str:
         """Generate an NPC description using AI.
@@ -26,7 +26,8 @@ class Armor(Item):
         strength_requirement: int = 0,
         dexterity_requirement: int = 0,
         value: float = 0.0,
-        weight: float = 0.0
+        weight: float = 0.0,
+        detailed_description: str = ""
     ) -> None:
         """Initialize a piece of armor.
         
@@ -39,6 +40,7 @@ class Armor(Item):
             dexterity_requirement: The minimum dexterity required to wear the armor
             value: The monetary value of the armor
             weight: The weight of the armor
+            detailed_description: A more detailed description of the armor
             
         Raises:
             ArmorError: If armor_rating is not a positive integer
@@ -46,6 +48,7 @@ class Armor(Item):
         super().__init__(
             name=name,
             description=description,
+            detailed_description=detailed_description,
             value=value,
             weight=weight
         )
@@ -57,6 +60,8 @@ class Armor(Item):
         self._armor_rating = armor_rating
         self._strength_requirement = strength_requirement
         self._dexterity_requirement = dexterity_requirement
+        # Both requirements in one attribute for can_wear
+        self._requirements = (strength_requirement, dexterity_requirement)
     
     @property
     def armor_type(self) -> ArmorType:
@@ -104,10 +109,8 @@ class Armor(Item):
         Returns:
             True if the character meets the requirements
         """
-        return (
-            strength >= self._strength_requirement and
-            dexterity >= self._dexterity_requirement
-        )
+        min_strength, min_dexterity = self._requirements
+        return strength >= min_strength and dexterity >= min_dexterity
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the armor to a dictionary.
@@ -5,13 +5,17 @@ import uuid
 class BaseModel:
     """Base model class for all dungeon entities."""
     
+    __slots__ = ('_id', '_id_str', '_created_at')
+    
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a base model.
         
         Args:
             **kwargs: Additional arguments
         """
-        self._id = uuid.uuid4()
+        # The UUID is generated on first access to id
+        self._id: Optional[uuid.UUID] = None
+        self._id_str: Optional[str] = None
         self._created_at = None  # Would be set to datetime.now() in a real implementation
         
     @property
@@ -21,8 +25,21 @@ class BaseModel:
         Returns:
             The model's UUID
         """
+        if self._id is None:
+            self._id = uuid.uuid4()
         return self._id
     
+    @property
+    def id_str(self) -> str:
+        """Get the model's ID as a string.
+        
+        Returns:
+            The model's UUID in its standard string form
+        """
+        if self._id_str is None:
+            self._id_str = str(self.id)
+        return self._id_str
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary.
         
@@ -30,6 +47,6 @@ class BaseModel:
             Dict containing the model's attributes
         """
         return {
-            "id": str(self._id),
+            "id": self.id_str,
             "created_at": self._created_at
         } 
\ No newline at end of file
@@ -21,6 +21,12 @@ class Alignment(Enum):
 class Character(BaseModel):
     """A character in the dungeon with attributes, inventory, and description."""
     
+    __slots__ = (
+        '_name', '_description', '_hit_points', '_dexterity', '_intelligence',
+        '_strength', '_gender', '_race', '_alignment', '_perception', '_wisdom',
+        '_inventory',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -335,21 +341,20 @@ class Character(BaseModel):
         Returns:
             Dict containing the character's attributes
         """
-        return {
-            **super().to_dict(),
-            "name": self.name,
-            "description": self.description,
-            "hit_points": float(self.hit_points),
-            "dexterity": self.dexterity,
-            "intelligence": self.intelligence,
-            "perception": self.perception,
-            "strength": self.strength,
-            "wisdom": self.wisdom,
-            "gender": self.gender,
-            "race": self.race,
-            "alignment": self.alignment.value,
-            "inventory": [item.to_dict() for item in self.inventory]
-        }
+        data = super().to_dict()
+        data["name"] = self._name
+        data["description"] = self._description
+        data["hit_points"] = float(self._hit_points)
+        data["dexterity"] = self._dexterity
+        data["intelligence"] = self._intelligence
+        data["perception"] = self._perception
+        data["strength"] = self._strength
+        data["wisdom"] = self._wisdom
+        data["gender"] = self._gender
+        data["race"] = self._race
+        data["alignment"] = self._alignment.value
+        data["inventory"] = [item.to_dict() for item in self._inventory]
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Character':
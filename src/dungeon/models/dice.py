@@ -11,14 +11,18 @@ class DiceError(Exception):
 class Dice(BaseModel):
     """A dice that can be rolled to generate random numbers."""
     
+    __slots__ = ('_sides', '_rng')
+    
     # Valid number of sides for dice
     VALID_SIDES = {4, 6, 8, 12, 20}
     
-    def __init__(self, sides: int = 6) -> None:
+    def __init__(self, sides: int = 6, rng: Optional[random.Random] = None) -> None:
         """Initialize a dice.
         
         Args:
             sides: The number of sides on the dice (must be 4, 6, 8, 12, or 20)
+            rng: Optional random number generator to roll with, e.g. a seeded
+                random.Random; defaults to the random module
             
         Raises:
             DiceError: If sides is not a valid number
@@ -28,6 +32,7 @@ class Dice(BaseModel):
             
         super().__init__()
         self._sides = sides
+        self._rng = rng
     
     @property
     def sides(self) -> int:
@@ -44,15 +49,23 @@ class Dice(BaseModel):
         Returns:
             A random number between 1 and the number of sides (inclusive)
         """
-        return random.randint(1, self._sides)
+        if self._rng is None:
+            return random.randint(1, self._sides)
+        return self._rng.randint(1, self._sides)
     
     @classmethod
-    def roll_multiple(cls, num_dice: int, sides: int = 6) -> List[int]:
+    def roll_multiple(
+        cls,
+        num_dice: int,
+        sides: int = 6,
+        rng: Optional[random.Random] = None
+    ) -> List[int]:
         """Roll multiple dice of the same type.
         
         Args:
             num_dice: The number of dice to roll
             sides: The number of sides on each dice
+            rng: Optional random number generator to roll with
             
         Returns:
             A list of random numbers, one for each dice
@@ -63,17 +76,24 @@ class Dice(BaseModel):
         if num_dice < 1:
             raise DiceError("Number of dice must be at least 1")
             
-        dice = cls(sides)
+        dice = cls(sides, rng)
         return [dice.roll() for _ in range(num_dice)]
     
     @classmethod
-    def roll_with_modifier(cls, num_dice: int, sides: int = 6, modifier: int = 0) -> int:
+    def roll_with_modifier(
+        cls,
+        num_dice: int,
+        sides: int = 6,
+        modifier: int = 0,
+        rng: Optional[random.Random] = None
+    ) -> int:
         """Roll multiple dice and add a modifier.
         
         Args:
             num_dice: The number of dice to roll
             sides: The number of sides on each dice
             modifier: A number to add to the sum of the dice rolls
+            rng: Optional random number generator to roll with
             
         Returns:
             The sum of all dice rolls plus the modifier
@@ -81,7 +101,7 @@ class Dice(BaseModel):
         Raises:
             DiceError: If sides is not a valid number or num_dice is less than 1
         """
-        rolls = cls.roll_multiple(num_dice, sides)
+        rolls = cls.roll_multiple(num_dice, sides, rng)
         return sum(rolls) + modifier
     
     def to_dict(self) -> dict:
@@ -90,7 +110,6 @@ class Dice(BaseModel):
         Returns:
             Dict containing the dice's attributes
         """
-        return {
-            **super().to_dict(),
-            "sides": self.sides
-        } 
\ No newline at end of file
+        data = super().to_dict()
+        data["sides"] = self._sides
+        return data 
\ No newline at end of file
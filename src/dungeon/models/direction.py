@@ -11,6 +11,10 @@ class Direction(Enum):
     EAST = ["east"]
     WEST = ["west"]
 
+    def __init__(self, *args) -> None:
+        # Stable position of the member in definition order, usable as a list index
+        self.ordinal = len(type(self).__members__)
+
     def __str__(self):
         return f"{self.name}"
     
@@ -177,6 +177,7 @@ class Dungeon:
                 # Now add items to the room
                 if "room_items" in room_data:
                     room_items = room_data["room_items"]
+                    new_items = []
                     for item_data in room_items:
                         item_type = item_data.get("item_type", "")
                         item_name = item_data.get("name", "")
@@ -228,8 +229,10 @@ class Dungeon:
                                 alias=item_alias
                             )
                         
-                        # Add the item to the room
-                        room.add_item(item, item_room_description)
+                        new_items.append((item, item_room_description))
+                    
+                    # Add the items to the room
+                    room.add_items(new_items)
                 else:
                     room_items = []
 
@@ -241,7 +244,7 @@ class Dungeon:
             
             # Generate AI Room Descriptions
             if self.ai_enabled:
-                for room in self.map.get_all_rooms():
+                for room in self.map.iter_rooms():
                     room.set_ai_description(self.ai_generator.room_description_generate(room.id, room))
                     room.set_ai_update(True)
             
@@ -279,14 +282,9 @@ class Dungeon:
                             direction = Direction[direction_str.upper()]
                             try:
                                 # First try to disconnect any existing connection in this direction
-                                if direction in self.map._connections[room.id]:
-                                    old_target_id = self.map._connections[room.id][direction]
-                                    # Remove the old connection from both rooms
-                                    del self.map._connections[room.id][direction]
-                                    opposite_direction = Direction.get_opposite(direction)
-                                    if opposite_direction in self.map._connections[old_target_id]:
-                                        del self.map._connections[old_target_id][opposite_direction]
-                                    print(f"DEBUG: Removed old connection from {room.name} {direction_str} to {self.map._rooms[old_target_id].name}")
+                                old_target = self.map.disconnect_direction(room.id, direction)
+                                if old_target is not None:
+                                    print(f"DEBUG: Removed old connection from {room.name} {direction_str} to {old_target.name}")
                                 
                                 # Now create the new connection
                                 self.map.connect_rooms(room.id, room_objects[target_ref_id].id, direction)
@@ -301,7 +299,7 @@ class Dungeon:
             
             # Debug output: show all connected rooms for each room
             print("\nDEBUG: Final room connections:")
-            for room in self.map.get_all_rooms():
+            for room in self.map.iter_rooms():
                 try:
                     connected = self.map.get_connected_rooms(room.id)
                     connections_str = ', '.join([f"{direction.value[0]} -> {connected_room.name}" for direction, connected_room in connected.items()])
@@ -311,7 +309,7 @@ class Dungeon:
             
             # Populate room_direction_info for each room
             print("DEBUG: Populating room_direction_info for each room")
-            for room in self.map.get_all_rooms():
+            for room in self.map.iter_rooms():
                 connected_rooms = self.map.get_connected_rooms(room.id)
                 
                 # Create descriptive room direction info based on connected rooms and their themes
@@ -489,7 +487,7 @@ class Dungeon:
             print(f"DEBUG: Attempting to get room with ID: {room_id}")
             # Check if the room exists in the map
             room_exists = False
-            for room in self.map.get_all_rooms():
+            for room in self.map.iter_rooms():
                 if str(room.id) == room_id:
                     room_exists = True
                     break
@@ -711,14 +709,14 @@ class Dungeon:
         # TODO: This is a hack we need to refactor this
         if self.current_room:
             # Get NPCs in the current room
-            npc_list = [npc.name.lower() for npc in self.current_room.npcs]
+            npc_list = [npc.name.lower() for npc in self.current_room.iter_npcs()]
             # Also add aliases if they exist
-            for npc in self.current_room.npcs:
+            for npc in self.current_room.iter_npcs():
                 if hasattr(npc, 'alias') and npc.alias:
                     npc_list.append(npc.alias.lower())
             
             # Get items in the current room
-            room_item_list = [item["item"].name.lower() for item in self.current_room.room_items]
+            room_item_list = [item["item"].name.lower() for item in self.current_room.iter_room_items()]
 
 
         
@@ -982,13 +980,11 @@ class Dungeon:
 
                     # Get target and subject
                     # Check room items first, then player inventory
-                     # Get all items in the current room
-                    room_items = self.current_room.room_items
                     player_items = self.player_character.inventory
                     
                     # Check each word against each item's name, alias, and item_type
                     for word in remaining_command_words:
-                        for item_dict in room_items:
+                        for item_dict in self.current_room.iter_room_items():
                             # Get the actual Item object from the dictionary
                             item = item_dict["item"]
                             
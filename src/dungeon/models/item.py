@@ -8,6 +8,11 @@ from .action import Action, ActionType
 class Item(BaseModel):
     """An item that can be found in a room."""
     
+    __slots__ = (
+        '_name', '_description', '_detailed_description', '_value', '_weight',
+        '_alias', '_item_type',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -235,13 +240,12 @@ class Item(BaseModel):
         Returns:
             Dict containing the item's attributes
         """
-        return {
-            **super().to_dict(),
-            "name": self.name,
-            "alias": self.alias,
-            "description": self.description,
-            "detailed_description": self.detailed_description,
-            "value": self.value,
-            "weight": self.weight,
-            "item_type": self._item_type,
-        } 
\ No newline at end of file
+        data = super().to_dict()
+        data["name"] = self._name
+        data["alias"] = self._alias.copy()
+        data["description"] = self._description
+        data["detailed_description"] = self._detailed_description
+        data["value"] = self._value
+        data["weight"] = self._weight
+        data["item_type"] = self._item_type
+        return data 
\ No newline at end of file
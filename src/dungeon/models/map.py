@@ -1,24 +1,169 @@
 """Map model for the dungeon project."""
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from collections import OrderedDict, deque
+from functools import lru_cache
 from uuid import UUID
 import math
 
 from .direction import Direction
 from .room import Room
 
+# Directions indexed by ordinal, used to decode the per-room connection slots
+_DIRECTIONS = tuple(Direction)
+
+# Opposite of each direction, indexed by ordinal
+_OPPOSITE = tuple(Direction.get_opposite(direction) for direction in _DIRECTIONS)
+
+# Horizontal directions considered when laying out the map
+_CARDINAL_DIRS = (Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST)
+
+# Connection slot indexes of the horizontal directions
+_CARDINAL_ORDINALS = tuple(direction.ordinal for direction in _CARDINAL_DIRS)
+
+# SVG element templates shared by every render
+_ROOM_ICON_SVG = '<image class="room_icon {room_class}" x="{x}" y="{y}" width="{size}" height="{size}" href="{href}" />'
+_PLAYER_MARKER_SVG = '<polygon points="{points}" fill="#99FF00" stroke="black" stroke-width="1" />'
+_ROOM_LABEL_SVG = '<text x="{x}" y="{y}" text-anchor="middle" class="text_class">{tspans}</text>'
+
+# Number of rendered SVGs kept per map
+_SVG_CACHE_SIZE = 4
+
+# Approximate size in characters of each chunk iter_svg yields, so streaming
+# callers write a few coarse chunks rather than one per room fragment
+_SVG_CHUNK_CHARS = 16 * 1024
+
+# Unit grid steps tried, in order, when a layout position is already occupied
+_SPIRAL_STEPS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(room_id: str) -> UUID:
+    """Parse a room ID string, caching recent results.
+    
+    Args:
+        room_id: The string form of the room ID
+        
+    Returns:
+        The parsed UUID
+        
+    Raises:
+        ValueError: If the string is not a valid UUID
+    """
+    return UUID(room_id)
+
+def _coerce_room_id(room_id: Union[UUID, str]) -> UUID:
+    """Convert a room ID given as a string to a UUID.
+    
+    Args:
+        room_id: The ID of the room (UUID or string)
+        
+    Returns:
+        The room ID as a UUID
+        
+    Raises:
+        KeyError: If the string is not a valid UUID
+    """
+    if isinstance(room_id, str):
+        try:
+            return _parse_uuid(room_id)
+        except ValueError:
+            print(f"DEBUG: Invalid UUID string: {room_id}")
+            raise KeyError(f"Invalid UUID string: {room_id}")
+    return room_id
+
 class Map:
-    """A map of connected rooms in the dungeon."""
+    """A map of connected rooms in the dungeon.
+    
+    Rooms are identified by UUID at the public boundary, but internally each
+    room is assigned a compact integer key when it is added. The graph
+    structures are indexed by these keys; keys are not stable across runs, so
+    serialization always uses the room UUIDs.
+    """
     
     def __init__(self) -> None:
         """Initialize an empty map."""
-        # Dictionary mapping room IDs to Room objects
-        self._rooms: Dict[UUID, Room] = {}
+        # Dictionary mapping room IDs to internal room keys
+        self._id_to_key: Dict[UUID, int] = {}
+        
+        # Rooms indexed by key (None once a room has been removed)
+        self._key_to_room: List[Optional[Room]] = []
         
-        # Dictionary mapping room IDs to dictionaries of directions to connected room IDs
-        self._connections: Dict[UUID, Dict[Direction, UUID]] = {}
+        # Connections indexed by key; each entry holds one slot per direction
+        # (indexed by Direction.ordinal) containing the connected room key or None
+        self._connections: List[Optional[List[Optional[int]]]] = []
         
-        # Set of room IDs that have been visited
-        self._visited_rooms: Set[UUID] = set()
+        # Bitmask of visited rooms; bit N is set when the room with key N has been visited
+        self._visited_mask: int = 0
+        
+        # Dictionary mapping room reference IDs to Room objects
+        self._rooms_by_ref: Dict[str, Room] = {}
+        
+        # Incremented whenever rooms, connections or visited state change
+        self._structure_version: int = 0
+        
+        # Deduplicated (key, connected key) pairs for the horizontal connections,
+        # built on first use and discarded whenever a connection changes
+        self._horizontal_edges: Optional[List[Tuple[int, int]]] = None
+        
+        # Recently rendered SVGs, keyed by (structure version, room radius, current room ID)
+        # and ordered from least to most recently used
+        self._svg_cache: 'OrderedDict[Tuple[int, int, Optional[UUID]], str]' = OrderedDict()
+    
+    def _insert_room(self, room_id: UUID, room: Room) -> None:
+        """Register a room under the given ID, assigning it a key if needed.
+        
+        Args:
+            room_id: The ID to register the room under
+            room: The room to register
+        """
+        key = self._id_to_key.get(room_id)
+        if key is None:
+            key = len(self._key_to_room)
+            self._id_to_key[room_id] = key
+            self._key_to_room.append(room)
+            self._connections.append([None] * len(_DIRECTIONS))
+        else:
+            replaced = self._key_to_room[key]
+            self._key_to_room[key] = room
+            self._connections[key] = [None] * len(_DIRECTIONS)
+            if replaced is not room:
+                self._unindex_ref(replaced)
+        self._rooms_by_ref.setdefault(room.room_ref_id, room)
+        self._structure_version += 1
+    
+    def _unindex_ref(self, room: Room) -> None:
+        """Drop a room that has left the map from the ref-id index.
+        
+        If the room was the indexed one for its ref ID, the first remaining
+        room with that ref ID takes its place, as the old linear scan found it.
+        
+        Args:
+            room: The room no longer stored in the map
+        """
+        room_ref_id = room.room_ref_id
+        if self._rooms_by_ref.get(room_ref_id) is not room:
+            return
+        del self._rooms_by_ref[room_ref_id]
+        for other in self._key_to_room:
+            if other is not None and other.room_ref_id == room_ref_id:
+                self._rooms_by_ref[room_ref_id] = other
+                break
+    
+    def _get_key(self, room_id: UUID) -> int:
+        """Get the internal key for a room ID.
+        
+        Args:
+            room_id: The ID of the room
+            
+        Returns:
+            The room's internal key
+            
+        Raises:
+            KeyError: If the room is not in the map
+        """
+        key = self._id_to_key.get(room_id)
+        if key is None:
+            raise KeyError(f"Room with ID {room_id} not found in map")
+        return key
     
     def add_room(self, room: Room) -> None:
         """Add a room to the map.
@@ -26,8 +171,7 @@ class Map:
         Args:
             room: The room to add
         """
-        self._rooms[room.id] = room
-        self._connections[room.id] = {}
+        self._insert_room(room.id, room)
     
     def remove_room(self, room_id: UUID) -> None:
         """Remove a room from the map.
@@ -38,22 +182,27 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        if room_id not in self._rooms:
-            raise KeyError(f"Room with ID {room_id} not found in map")
+        key = self._get_key(room_id)
         
         # Remove connections to this room from other rooms
-        for connected_room_id, connections in self._connections.items():
-            for direction, connected_id in list(connections.items()):
-                if connected_id == room_id:
-                    del connections[direction]
+        for connections in self._connections:
+            if connections is None:
+                continue
+            for ordinal, connected_key in enumerate(connections):
+                if connected_key == key:
+                    connections[ordinal] = None
         
-        # Remove the room and its connections
-        del self._rooms[room_id]
-        del self._connections[room_id]
+        # Remove the room and its connections, leaving its key slot empty
+        room = self._key_to_room[key]
+        del self._id_to_key[room_id]
+        self._key_to_room[key] = None
+        self._connections[key] = None
+        self._unindex_ref(room)
         
         # Remove from visited rooms if present
-        if room_id in self._visited_rooms:
-            self._visited_rooms.remove(room_id)
+        self._visited_mask &= ~(1 << key)
+        self._horizontal_edges = None
+        self._structure_version += 1
     
     def connect_rooms(self, room_id1: UUID, room_id2: UUID, direction: Direction) -> None:
         """Connect two rooms in a specific direction.
@@ -69,21 +218,25 @@ class Map:
         """
         print(f"DEBUG: Connecting rooms: {room_id1} {direction.value} to {room_id2}")
         
-        if room_id1 not in self._rooms or room_id2 not in self._rooms:
-            print(f"DEBUG: One or both rooms not found. Room1: {room_id1 in self._rooms}, Room2: {room_id2 in self._rooms}")
-            print(f"DEBUG: Available room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
+        key1 = self._id_to_key.get(room_id1)
+        key2 = self._id_to_key.get(room_id2)
+        if key1 is None or key2 is None:
+            print(f"DEBUG: One or both rooms not found. Room1: {key1 is not None}, Room2: {key2 is not None}")
+            print(f"DEBUG: Available room IDs: {[str(room_id) for room_id in self._id_to_key]}")
             raise KeyError("One or both rooms not found in map")
         
-        if direction in self._connections[room_id1]:
+        if self._connections[key1][direction.ordinal] is not None:
             print(f"DEBUG: Room {room_id1} already has a connection in direction {direction.value}")
             raise ValueError(f"Room {room_id1} already has a connection in direction {direction.value}")
         
         # Add connection from room1 to room2
-        self._connections[room_id1][direction] = room_id2
+        self._connections[key1][direction.ordinal] = key2
         
         # Add connection from room2 to room1 in the opposite direction
-        opposite_direction = Direction.get_opposite(direction)
-        self._connections[room_id2][opposite_direction] = room_id1
+        opposite_direction = _OPPOSITE[direction.ordinal]
+        self._connections[key2][opposite_direction.ordinal] = key1
+        self._horizontal_edges = None
+        self._structure_version += 1
         
         print(f"DEBUG: Connection established: {room_id1} {direction.value} to {room_id2}")
         print(f"DEBUG: Reverse connection established: {room_id2} {opposite_direction.value} to {room_id1}")
@@ -99,25 +252,56 @@ class Map:
             KeyError: If either room is not in the map
             ValueError: If the rooms are not connected
         """
-        if room_id1 not in self._rooms or room_id2 not in self._rooms:
+        key1 = self._id_to_key.get(room_id1)
+        key2 = self._id_to_key.get(room_id2)
+        if key1 is None or key2 is None:
             raise KeyError("One or both rooms not found in map")
         
         # Find the direction from room1 to room2
-        direction = None
-        for dir, connected_id in self._connections[room_id1].items():
-            if connected_id == room_id2:
-                direction = dir
-                break
-        
-        if direction is None:
+        try:
+            direction = _DIRECTIONS[self._connections[key1].index(key2)]
+        except ValueError:
             raise ValueError(f"Rooms {room_id1} and {room_id2} are not connected")
         
         # Remove connection from room1 to room2
-        del self._connections[room_id1][direction]
+        self._connections[key1][direction.ordinal] = None
         
         # Remove connection from room2 to room1 in the opposite direction
-        opposite_direction = Direction.get_opposite(direction)
-        del self._connections[room_id2][opposite_direction]
+        self._connections[key2][_OPPOSITE[direction.ordinal].ordinal] = None
+        self._horizontal_edges = None
+        self._structure_version += 1
+    
+    def disconnect_direction(self, room_id: UUID, direction: Direction) -> Optional[Room]:
+        """Remove the connection leaving a room in a specific direction.
+        
+        The reverse connection is removed as well if it leads back to the room.
+        
+        Args:
+            room_id: The ID of the room
+            direction: The direction of the connection to remove
+            
+        Returns:
+            The room that was connected in that direction, or None if there was no connection
+            
+        Raises:
+            KeyError: If the room is not in the map
+        """
+        key = self._get_key(room_id)
+        
+        connections = self._connections[key]
+        connected_key = connections[direction.ordinal]
+        if connected_key is None:
+            return None
+        connections[direction.ordinal] = None
+        
+        reverse_connections = self._connections[connected_key]
+        opposite_ordinal = _OPPOSITE[direction.ordinal].ordinal
+        if reverse_connections[opposite_ordinal] == key:
+            reverse_connections[opposite_ordinal] = None
+        self._horizontal_edges = None
+        self._structure_version += 1
+        
+        return self._key_to_room[connected_key]
     
     def get_connected_room(self, room_id: Union[UUID, str], direction: Direction) -> Optional[Room]:
         """Get the room connected to the given room in the specified direction.
@@ -132,37 +316,22 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        # Convert string UUID to UUID object if needed
-        if isinstance(room_id, str):
-            try:
-                room_id = UUID(room_id)
-            except ValueError:
-                print(f"DEBUG: Invalid UUID string: {room_id}")
-                raise KeyError(f"Invalid UUID string: {room_id}")
+        room_id = _coerce_room_id(room_id)
         
         print(f"DEBUG: Getting room connected to {room_id} in direction {direction.value}")
-        print(f"DEBUG: Room ID type: {type(room_id)}")
-        
-        # Check if the room exists by comparing string representations
-        room_exists = False
-        for existing_id in self._rooms.keys():
-            if str(existing_id) == str(room_id):
-                room_exists = True
-                room_id = existing_id  # Use the existing UUID object
-                break
         
-        if not room_exists:
-            print(f"DEBUG: Room with ID {room_id} not found in map. Available room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
+        key = self._id_to_key.get(room_id)
+        if key is None:
+            print(f"DEBUG: Room with ID {room_id} not found in map. Available room IDs: {[str(room_id) for room_id in self._id_to_key]}")
             raise KeyError(f"Room with ID {room_id} not found in map")
         
-        connected_id = self._connections[room_id].get(direction)
-        print(f"DEBUG: Connected room ID: {connected_id}")
+        connected_key = self._connections[key][direction.ordinal]
         
-        if connected_id is None:
+        if connected_key is None:
             print(f"DEBUG: No connection found in direction {direction.value}")
             return None
         
-        return self._rooms[connected_id]
+        return self._key_to_room[connected_key]
     
     def get_connected_rooms(self, room_id: Union[UUID, str]) -> Dict[Direction, Room]:
         """Get all rooms connected to the given room.
@@ -176,37 +345,19 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        # Convert string UUID to UUID object if needed
-        if isinstance(room_id, str):
-            try:
-                room_id = UUID(room_id)
-            except ValueError:
-                print(f"DEBUG: Invalid UUID string: {room_id}")
-                raise KeyError(f"Invalid UUID string: {room_id}")
-        
-        print(f"DEBUG: Getting connected rooms for room ID: {room_id} (type: {type(room_id)})")
-        print(f"DEBUG: Available room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
-        print(f"DEBUG: Room ID in map: {room_id in self._rooms}")
-        
-        # Check if the room exists by comparing string representations
-        room_exists = False
-        for existing_id in self._rooms.keys():
-            if str(existing_id) == str(room_id):
-                room_exists = True
-                room_id = existing_id  # Use the existing UUID object
-                break
+        room_id = _coerce_room_id(room_id)
         
-        if not room_exists:
-            print(f"DEBUG: Room with ID {room_id} not found in map. Available room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
+        key = self._id_to_key.get(room_id)
+        if key is None:
+            print(f"DEBUG: Room with ID {room_id} not found in map. Available room IDs: {[str(room_id) for room_id in self._id_to_key]}")
             raise KeyError(f"Room with ID {room_id} not found in map")
         
-        print(f"DEBUG: Available connections: {[(direction.value, str(connected_id)) for direction, connected_id in self._connections[room_id].items()]}")
-        
-        result = {}
-        for direction, connected_id in self._connections[room_id].items():
-            result[direction] = self._rooms[connected_id]
-        
-        return result
+        key_to_room = self._key_to_room
+        return {
+            direction: key_to_room[connected_key]
+            for direction, connected_key in zip(_DIRECTIONS, self._connections[key])
+            if connected_key is not None
+        }
     
     def mark_room_visited(self, room_id: UUID) -> None:
         """Mark a room as visited.
@@ -217,10 +368,10 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        if room_id not in self._rooms:
-            raise KeyError(f"Room with ID {room_id} not found in map")
-        
-        self._visited_rooms.add(room_id)
+        bit = 1 << self._get_key(room_id)
+        if not self._visited_mask & bit:
+            self._visited_mask |= bit
+            self._structure_version += 1
     
     def is_room_visited(self, room_id: UUID) -> bool:
         """Check if a room has been visited.
@@ -234,10 +385,7 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        if room_id not in self._rooms:
-            raise KeyError(f"Room with ID {room_id} not found in map")
-        
-        return room_id in self._visited_rooms
+        return bool(self._visited_mask >> self._get_key(room_id) & 1)
     
     def get_rooms_within_distance(self, room_id: UUID, distance: int) -> List[Tuple[Room, int]]:
         """Get all rooms within a certain distance from the given room.
@@ -252,29 +400,25 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        if room_id not in self._rooms:
-            raise KeyError(f"Room with ID {room_id} not found in map")
+        start_key = self._get_key(room_id)
         
         result = []
-        visited = {room_id}
-        queue = [(room_id, 0)]
-        
-        while queue:
-            current_id, current_distance = queue.pop(0)
-            
-            # Add the current room to the result if it's not the starting room
-            if current_id != room_id:
-                result.append((self._rooms[current_id], current_distance))
+        visited = {start_key}
+        frontier = [start_key]
+        
+        # Expand one ring of rooms per step so each room's distance is the step number
+        for current_distance in range(1, distance + 1):
+            next_frontier = []
+            for current_key in frontier:
+                for connected_key in self._connections[current_key]:
+                    if connected_key is not None and connected_key not in visited:
+                        visited.add(connected_key)
+                        next_frontier.append(connected_key)
+                        result.append((self._key_to_room[connected_key], current_distance))
             
-            # If we've reached the maximum distance, stop
-            if current_distance >= distance:
-                continue
-            
-            # Add all connected rooms to the queue
-            for connected_id in self._connections[current_id].values():
-                if connected_id not in visited:
-                    visited.add(connected_id)
-                    queue.append((connected_id, current_distance + 1))
+            if not next_frontier:
+                break
+            frontier = next_frontier
         
         return result
     
@@ -290,19 +434,14 @@ class Map:
         Raises:
             KeyError: If the room is not in the map
         """
-        # Convert string UUID to UUID object if needed
-        if isinstance(room_id, str):
-            try:
-                room_id = UUID(room_id)
-            except ValueError:
-                print(f"DEBUG: Invalid UUID string: {room_id}")
-                raise KeyError(f"Invalid UUID string: {room_id}")
+        room_id = _coerce_room_id(room_id)
         
-        if room_id not in self._rooms:
-            print(f"DEBUG: Room with ID {room_id} not found. Available room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
+        key = self._id_to_key.get(room_id)
+        if key is None:
+            print(f"DEBUG: Room with ID {room_id} not found. Available room IDs: {[str(room_id) for room_id in self._id_to_key]}")
             raise KeyError(f"Room with ID {room_id} not found in map")
         
-        return self._rooms[room_id]
+        return self._key_to_room[key]
     
     def get_room_by_ref_id(self, room_ref_id: str) -> Optional[Room]:
         """Get a room by its reference ID.
@@ -313,11 +452,7 @@ class Map:
         Returns:
             The room with the given reference ID, or None if not found
         """
-        for room in self._rooms.values():
-            if room.room_ref_id == room_ref_id:
-                return room
-        
-        return None
+        return self._rooms_by_ref.get(room_ref_id)
     
     def get_all_rooms(self) -> List[Room]:
         """Get all rooms in the map.
@@ -325,7 +460,15 @@ class Map:
         Returns:
             A list of all rooms in the map
         """
-        return list(self._rooms.values())
+        return [room for room in self._key_to_room if room is not None]
+    
+    def iter_rooms(self) -> Iterator[Room]:
+        """Iterate over all rooms in the map without building a list.
+        
+        Returns:
+            An iterator over all rooms in the map
+        """
+        return (room for room in self._key_to_room if room is not None)
     
     def get_visited_rooms(self) -> List[Room]:
         """Get all visited rooms in the map.
@@ -333,7 +476,19 @@ class Map:
         Returns:
             A list of all visited rooms in the map
         """
-        return [self._rooms[room_id] for room_id in self._visited_rooms]
+        return [self._key_to_room[key] for key in self._iter_visited_keys()]
+    
+    def _iter_visited_keys(self) -> Iterator[int]:
+        """Yield the keys of visited rooms in ascending order.
+        
+        Returns:
+            An iterator over the set bits of the visited mask
+        """
+        mask = self._visited_mask
+        while mask:
+            lowest_bit = mask & -mask
+            yield lowest_bit.bit_length() - 1
+            mask ^= lowest_bit
     
     def get_unvisited_rooms(self) -> List[Room]:
         """Get all unvisited rooms in the map.
@@ -341,7 +496,10 @@ class Map:
         Returns:
             A list of all unvisited rooms in the map
         """
-        return [room for room_id, room in self._rooms.items() if room_id not in self._visited_rooms]
+        return [
+            room for key, room in enumerate(self._key_to_room)
+            if room is not None and not self._visited_mask >> key & 1
+        ]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the map to a dictionary.
@@ -349,16 +507,20 @@ class Map:
         Returns:
             Dict containing the map's attributes
         """
-        rooms_dict = {str(room_id): room.to_dict() for room_id, room in self._rooms.items()}
+        # Room keys are internal; translate them back to UUIDs for serialization
+        key_to_id = {key: room_id for room_id, key in self._id_to_key.items()}
+        
+        rooms_dict = {str(room_id): self._key_to_room[key].to_dict() for room_id, key in self._id_to_key.items()}
         
         connections_dict = {}
-        for room_id, connections in self._connections.items():
+        for room_id, key in self._id_to_key.items():
             connections_dict[str(room_id)] = {
-                direction.value: str(connected_id)
-                for direction, connected_id in connections.items()
+                _DIRECTIONS[ordinal].value: str(key_to_id[connected_key])
+                for ordinal, connected_key in enumerate(self._connections[key])
+                if connected_key is not None
             }
         
-        visited_rooms = [str(room_id) for room_id in self._visited_rooms]
+        visited_rooms = [str(key_to_id[key]) for key in self._iter_visited_keys()]
         
         return {
             "rooms": rooms_dict,
@@ -370,6 +532,10 @@ class Map:
     def from_dict(cls, data: Dict[str, Any], room_objects: Dict[str, Room]) -> 'Map':
         """Create a map from a dictionary.
         
+        Connection and visited-room IDs are matched to rooms by UUID value, so
+        they may differ from the room_objects keys in case or hyphenation. IDs
+        that match no room are reported and skipped.
+        
         Args:
             data: The dictionary containing the map data
             room_objects: Dictionary mapping room IDs to Room objects
@@ -379,21 +545,43 @@ class Map:
         """
         map_instance = cls()
         
-        # Add rooms to the map
+        # Add rooms to the map, resolving each string ID to its room key once
+        str_to_key: Dict[str, int] = {}
         for room_id, room in room_objects.items():
-            map_instance._rooms[UUID(room_id)] = room
-            map_instance._connections[UUID(room_id)] = {}
+            room_uuid = UUID(room_id)
+            map_instance._insert_room(room_uuid, room)
+            str_to_key[room_id] = map_instance._id_to_key[room_uuid]
+        
+        def resolve_key(room_id: str) -> Optional[int]:
+            """Find the key of a room ID from the map data, or None if no room has it."""
+            key = str_to_key.get(room_id)
+            if key is not None:
+                return key
+            # Spelled differently from the room_objects key (case, hyphens), or unknown
+            try:
+                key = map_instance._id_to_key.get(_coerce_room_id(room_id))
+            except KeyError:
+                key = None
+            if key is None:
+                print(f"DEBUG: Skipping unknown room ID in map data: {room_id}")
+            return key
         
         # Add connections
         for room_id, connections in data.get("connections", {}).items():
-            room_uuid = UUID(room_id)
+            key = resolve_key(room_id)
+            if key is None:
+                continue
+            room_slots = map_instance._connections[key]
             for direction_str, connected_id in connections.items():
-                direction = Direction(direction_str)
-                map_instance._connections[room_uuid][direction] = UUID(connected_id)
+                connected_key = resolve_key(connected_id)
+                if connected_key is not None:
+                    room_slots[Direction(direction_str).ordinal] = connected_key
         
         # Add visited rooms
         for room_id in data.get("visited_rooms", []):
-            map_instance._visited_rooms.add(UUID(room_id))
+            key = resolve_key(room_id)
+            if key is not None:
+                map_instance._visited_mask |= 1 << key
         
         return map_instance
     
@@ -643,6 +831,34 @@ class Map:
         room = self.get_room_by_id(room_id)
         room.remove_trap(trap)
     
+    def _get_horizontal_edges(self) -> List[Tuple[int, int]]:
+        """Get the horizontal connections to draw on the map.
+        
+        Each connected pair of rooms appears once, however many cardinal
+        slots link them; UP and DOWN connections are not included.
+        
+        Returns:
+            A list of (room key, connected room key) pairs
+        """
+        if self._horizontal_edges is None:
+            edges: List[Tuple[int, int]] = []
+            seen: Set[Tuple[int, int]] = set()
+            for key in self._id_to_key.values():
+                slots = self._connections[key]
+                for ordinal in _CARDINAL_ORDINALS:
+                    connected_key = slots[ordinal]
+                    if connected_key is None:
+                        continue
+                    
+                    # Two-way connections only need to be drawn once
+                    edge = (key, connected_key) if key < connected_key else (connected_key, key)
+                    if edge in seen:
+                        continue
+                    seen.add(edge)
+                    edges.append((key, connected_key))
+            self._horizontal_edges = edges
+        return self._horizontal_edges
+    
     def to_svg(self, room_radius: int = 30, current_room_id: Optional[UUID] = None) -> str:
         """Generate an SVG representation of the map.
         
@@ -653,122 +869,177 @@ class Map:
         Returns:
             An SVG string representing the map
         """
-        print("\nDEBUG: Starting SVG generation...")
-        print(f"DEBUG: Total rooms in map: {len(self._rooms)}")
-        print(f"DEBUG: Room IDs: {[str(room_id) for room_id in self._rooms.keys()]}")
-        print(f"DEBUG: Connections: {[(str(room_id), direction.value, str(connected_id)) for room_id, connections in self._connections.items() for direction, connected_id in connections.items()]}")
+        return ''.join(self.iter_svg(room_radius, current_room_id))
+    
+    def get_cached_svg(self, room_radius: int = 30, current_room_id: Optional[UUID] = None) -> Optional[str]:
+        """Get an earlier rendering of the map if nothing that affects it has changed.
         
-        # Get all rooms
-        rooms = self.get_all_rooms()
-        if not rooms:
-            print("DEBUG: No rooms found in map")
-            return '<svg width="100" height="100"><text x="50%" y="50%" text-anchor="middle">No rooms in map</text></svg>'
+        Args:
+            room_radius: The radius of the room circles in pixels
+            current_room_id: The ID of the current room where the player is located
+            
+        Returns:
+            The cached SVG string, or None if the map has to be rendered again
+        """
+        cache_key = (self._structure_version, room_radius, current_room_id)
+        cached_svg = self._svg_cache.get(cache_key)
+        if cached_svg is not None:
+            self._svg_cache.move_to_end(cache_key)
+        return cached_svg
+    
+    def iter_svg(self, room_radius: int = 30, current_room_id: Optional[UUID] = None) -> Iterator[str]:
+        """Generate an SVG representation of the map as a sequence of chunks.
+        
+        Lets callers such as web handlers stream the SVG as it is built. The
+        markup is yielded in chunks of roughly _SVG_CHUNK_CHARS characters.
+        Once fully consumed, the result is cached and replayed as a single
+        chunk until the map changes. The most recent renderings are kept, so
+        alternating between a few current rooms or sizes stays cached.
+        
+        The iterator reads the map lazily, so the map must not be modified
+        while it is being consumed.
         
-        print(f"DEBUG: Found {len(rooms)} rooms to place")
+        Args:
+            room_radius: The radius of the room circles in pixels
+            current_room_id: The ID of the current room where the player is located
+            
+        Returns:
+            An iterator over the SVG markup chunks
+        """
+        # Reuse an earlier rendering if nothing that affects it has changed
+        cached_svg = self.get_cached_svg(room_radius, current_room_id)
+        if cached_svg is not None:
+            yield cached_svg
+            return
+        
+        cache_key = (self._structure_version, room_radius, current_room_id)
+        
+        chunks: List[str] = []
+        pending: List[str] = []
+        pending_size = 0
+        for fragment in self._generate_svg(room_radius, current_room_id):
+            pending.append(fragment)
+            pending_size += len(fragment)
+            if pending_size >= _SVG_CHUNK_CHARS:
+                chunk = ''.join(pending)
+                chunks.append(chunk)
+                yield chunk
+                pending.clear()
+                pending_size = 0
+        if pending:
+            chunk = ''.join(pending)
+            chunks.append(chunk)
+            yield chunk
+        self._svg_cache[cache_key] = ''.join(chunks)
+        if len(self._svg_cache) > _SVG_CACHE_SIZE:
+            self._svg_cache.popitem(last=False)
+    
+    def _layout_rooms(self, room_radius: int) -> Tuple[List[Optional[int]], List[Optional[int]], List[int], int, int]:
+        """Work out where each room is drawn on the map.
         
+        Args:
+            room_radius: The radius of the room circles in pixels
+            
+        Returns:
+            A tuple of (xs, ys, placement_order, width, height), where xs and ys
+            hold each room's pixel position indexed by room key, placement_order
+            lists the room keys in the order they were laid out, and width and
+            height are the size of the drawing
+        """
         # Calculate room positions using a simple grid layout
-        # This is a basic implementation - a more sophisticated layout algorithm could be used
-        room_positions = {}
+        # This is a basic implementation - a more sophisticated layout algorithm could be used.
+        # Positions are kept in two parallel lists indexed by room key, and
+        # placement_order records the order in which rooms were laid out
+        num_keys = len(self._key_to_room)
+        xs: List[Optional[float]] = [None] * num_keys
+        ys: List[Optional[float]] = [None] * num_keys
+        placement_order: List[int] = []
         
         # Increase spacing between rooms to prevent overlapping
         #spacing = room_radius * 4  # Increased from 3 to 4
         spacing = room_radius * 3
         
-        # Function to check if a position overlaps with existing rooms
-        def position_overlaps(x, y, existing_positions, min_distance=room_radius*2.5):
-            for pos_x, pos_y in existing_positions.values():
-                distance = ((x - pos_x) ** 2 + (y - pos_y) ** 2) ** 0.5
-                if distance < min_distance:
-                    return True
-            return False
+        # Rooms are placed on a grid of the given spacing, so two rooms overlap
+        # exactly when they fall in the same grid cell
+        occupied_cells: Set[Tuple[int, int]] = set()
+        
+        def grid_cell(x: float, y: float) -> Tuple[int, int]:
+            return (round(x / spacing), round(y / spacing))
+        
+        # Offset from a placed room to its neighbor in each cardinal direction
+        offsets = {
+            Direction.NORTH: (0, -spacing),
+            Direction.SOUTH: (0, spacing),
+            Direction.EAST: (spacing, 0),
+            Direction.WEST: (-spacing, 0),
+        }
         
         # Start with the first room at the center
-        if rooms:
-            center_room = rooms[0]
-            room_positions[center_room.id] = (0, 0)  # Start at origin
-            
-            # Place other rooms relative to their connections
-            placed_rooms = {center_room.id}
-            rooms_to_place = [r for r in rooms if r.id != center_room.id]
-            
-            # Simple placement algorithm - place rooms in a grid based on their connections
-            while rooms_to_place:
-                for room in rooms[:]:  # Create a copy to avoid modifying during iteration
-                    if room.id in placed_rooms:
+        if self._id_to_key:
+            center_room = next(self.iter_rooms())
+            center_key = self._id_to_key[center_room.id]
+            xs[center_key] = ys[center_key] = 0  # Start at origin
+            placement_order.append(center_key)
+            occupied_cells.add((0, 0))
+            
+            # Place other rooms by walking outwards from the center room, positioning
+            # each newly discovered neighbor relative to the room it was reached from
+            queue = deque([center_key])
+            
+            while queue:
+                current_key = queue.popleft()
+                current_x, current_y = xs[current_key], ys[current_key]
+                slots = self._connections[current_key]
+                
+                for direction in _CARDINAL_DIRS:
+                    connected_key = slots[direction.ordinal]
+                    if connected_key is None or xs[connected_key] is not None:
                         continue
                     
-                    # Find a connected room that's already placed
-                    connected_placed_room = None
-                    direction_to_placed = None
+                    dx, dy = offsets[direction]
+                    x, y = current_x + dx, current_y + dy
                     
-                    for direction in [Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST]:
-                        try:
-                            connected_room = self.get_connected_room(room.id, direction)
-                            if connected_room and connected_room.id in placed_rooms:
-                                connected_placed_room = connected_room
-                                direction_to_placed = direction
-                                break
-                        except (KeyError, ValueError):
-                            continue
+                    # If the position overlaps with existing rooms, try to find a nearby non-overlapping position
+                    if grid_cell(x, y) in occupied_cells:
+                        # Try positions in a spiral pattern around the original position
+                        for i in range(1, 5):  # Try up to 4 alternative positions
+                            for step_x, step_y in _SPIRAL_STEPS:  # Try 4 directions
+                                new_x = x + i * spacing * step_x
+                                new_y = y + i * spacing * step_y
+                                
+                                if grid_cell(new_x, new_y) not in occupied_cells:
+                                    x, y = new_x, new_y
+                                    break
+                            else:
+                                continue
+                            break
                     
-                    if connected_placed_room:
-                        # Place this room relative to the connected room
-                        x, y = room_positions[connected_placed_room.id]
-                        
-                        # Calculate offset based on direction
-                        if direction_to_placed == Direction.NORTH:
-                            y += spacing
-                        elif direction_to_placed == Direction.SOUTH:
-                            y -= spacing
-                        elif direction_to_placed == Direction.EAST:
-                            x -= spacing
-                        elif direction_to_placed == Direction.WEST:
-                            x += spacing
-                        
-                        # If the position overlaps with existing rooms, try to find a nearby non-overlapping position
-                        if position_overlaps(x, y, room_positions):
-                            # Try positions in a spiral pattern around the original position
-                            for i in range(1, 5):  # Try up to 4 alternative positions
-                                for angle in range(0, 360, 90):  # Try 4 directions
-                                    rad = angle * 3.14159 / 180
-                                    new_x = x + i * spacing * 0.5 * math.cos(rad)
-                                    new_y = y + i * spacing * 0.5 * math.sin(rad)
-                                    
-                                    if not position_overlaps(new_x, new_y, room_positions):
-                                        x, y = new_x, new_y
-                                        break
-                                else:
-                                    continue
-                                break
-                        
-                        room_positions[room.id] = (x, y)
-                        placed_rooms.add(room.id)
-                        rooms_to_place.remove(room)
-                        break
+                    xs[connected_key], ys[connected_key] = x, y
+                    placement_order.append(connected_key)
+                    occupied_cells.add(grid_cell(x, y))
+                    queue.append(connected_key)
+            
+            keys_to_place = [key for key in self._id_to_key.values() if xs[key] is None]
             
             # If any rooms couldn't be placed, place them in a grid pattern
-            if rooms_to_place:
-                print(f"DEBUG: {len(rooms_to_place)} rooms couldn't be placed by connections, using grid layout")
-                grid_size = int(math.ceil(math.sqrt(len(rooms_to_place))))
+            if keys_to_place:
+                print(f"DEBUG: {len(keys_to_place)} rooms couldn't be placed by connections, using grid layout")
+                grid_size = int(math.ceil(math.sqrt(len(keys_to_place))))
                 
-                for i, room in enumerate(rooms_to_place):
+                for i, key in enumerate(keys_to_place):
                     row = i // grid_size
                     col = i % grid_size
-                    x = col * spacing
-                    y = row * spacing
-                    
-                    room_positions[room.id] = (x, y)
-                    placed_rooms.add(room.id)
+                    xs[key] = col * spacing
+                    ys[key] = row * spacing
+                    placement_order.append(key)
         
         # Calculate the bounds of the SVG based on room positions
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        for x, y in room_positions.values():
-            min_x = min(min_x, x - room_radius)
-            min_y = min(min_y, y - room_radius)
-            max_x = max(max_x, x + room_radius)
-            max_y = max(max_y, y + room_radius)
+        placed_xs = [xs[key] for key in placement_order]
+        placed_ys = [ys[key] for key in placement_order]
+        min_x = min(placed_xs) - room_radius
+        min_y = min(placed_ys) - room_radius
+        max_x = max(placed_xs) + room_radius
+        max_y = max(placed_ys) + room_radius
         
         # Add padding
         padding = room_radius * 2
@@ -778,17 +1049,43 @@ class Map:
         max_y += padding
         
         # Calculate width and height
-        width = max_x - min_x
-        height = max_y - min_y
+        width = round(max_x - min_x)
+        height = round(max_y - min_y)
+        
+        # Adjust all positions to be relative to the top-left corner, rounded to
+        # whole pixels to keep the emitted coordinates short
+        for key in placement_order:
+            xs[key] = round(xs[key] - min_x)
+            ys[key] = round(ys[key] - min_y)
+        
+        return xs, ys, placement_order, width, height
+    
+    def _generate_svg(self, room_radius: int, current_room_id: Optional[UUID]) -> Iterator[str]:
+        """Lay out the map and generate its SVG markup.
+        
+        Args:
+            room_radius: The radius of the room circles in pixels
+            current_room_id: The ID of the current room where the player is located
+            
+        Returns:
+            An iterator over the SVG markup fragments
+        """
+        print("\nDEBUG: Starting SVG generation...")
+        print(f"DEBUG: Total rooms in map: {len(self._id_to_key)}")
+        print(f"DEBUG: Room IDs: {[str(room_id) for room_id in self._id_to_key]}")
         
-        # Adjust all positions to be relative to the top-left corner
-        adjusted_positions = {}
-        for room_id, (x, y) in room_positions.items():
-            adjusted_positions[room_id] = (x - min_x, y - min_y)
+        if not self._id_to_key:
+            print("DEBUG: No rooms found in map")
+            yield '<svg width="100" height="100"><text x="50%" y="50%" text-anchor="middle">No rooms in map</text></svg>'
+            return
+        
+        print(f"DEBUG: Found {len(self._id_to_key)} rooms to place")
+        
+        xs, ys, placement_order, width, height = self._layout_rooms(room_radius)
         
         # Generate SVG
-        svg = f'<?xml version="1.0" encoding="UTF-8"?><svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">'
-        svg+= '''
+        yield f'<?xml version="1.0" encoding="UTF-8"?><svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">'
+        yield '''
             <defs>
                 <style>
                 .text_class {
@@ -815,31 +1112,38 @@ class Map:
                 }
                 </style>
             </defs>'''
-        # Add connections (lines)
-        for room_id, connections in self._connections.items():
-            if room_id in adjusted_positions:
-                x1, y1 = adjusted_positions[room_id]
-                
-                for direction, connected_id in connections.items():
-                    # Skip UP and DOWN directions as requested
-                    if direction in [Direction.UP, Direction.DOWN]:
-                        continue
-                    
-                    if connected_id in adjusted_positions:
-                        x2, y2 = adjusted_positions[connected_id]
-                        
-                        # Draw a line from room to connected room
-                        svg += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="black" stroke-width="2" />'
+        # Add connections (lines), batched into a single path
+        path_segments = [
+            f'M{xs[key]} {ys[key]}L{xs[connected_key]} {ys[connected_key]}'
+            for key, connected_key in self._get_horizontal_edges()
+        ]
+        if path_segments:
+            yield f'<path d="{"".join(path_segments)}" stroke="black" stroke-width="2" fill="none" />'
+        
+        # Calculate icon size (diameter of the circle) and fill it into the icon template once
+        icon_size = room_radius * 2
+        icon_template = _ROOM_ICON_SVG.replace("{size}", str(icon_size))
+        
+        # Labels sit at a fixed offset below each room's centre
+        label_offset = room_radius + 20
+        
+        # The player indicator is a green triangle just below the current room's icon
+        current_key = self._id_to_key.get(current_room_id) if current_room_id is not None else None
+        triangle_size = round(room_radius * 0.3)
+        triangle_offset = room_radius + 5
+        triangle_top = triangle_offset - triangle_size
+        triangle_bottom = triangle_offset + triangle_size
+        
+        key_to_room = self._key_to_room
+        visited_mask = self._visited_mask
         
         # Add rooms (using theme icons instead of circles)
-        for room_id, (x, y) in adjusted_positions.items():
-            room = self._rooms[room_id]
+        for key in placement_order:
+            x, y = xs[key], ys[key]
+            room = key_to_room[key]
             
             # Get the theme icon from the room's theme
-            theme_icon = room.theme.icon if hasattr(room.theme, 'icon') else "/static/img/icon/default_icon.webp"
-            
-            # Calculate icon size (diameter of the circle)
-            icon_size = room_radius * 2
+            theme_icon = getattr(room.theme, 'icon', "/static/img/icon/default_icon.webp")
             
             # Calculate icon position (center of the circle)
             icon_x = x - room_radius
@@ -847,39 +1151,17 @@ class Map:
             
             # Draw the room icon
             # Determine if the room has been visited
-            room_class = "room_visited" if room_id in self._visited_rooms else "room_unvisited"
-            svg += f'<image class="room_icon {room_class}" x="{icon_x}" y="{icon_y}" width="{icon_size}" height="{icon_size}" href="{theme_icon}" />'
+            room_class = "room_visited" if visited_mask >> key & 1 else "room_unvisited"
+            yield icon_template.format(room_class=room_class, x=icon_x, y=icon_y, href=theme_icon)
             
             # Add player indicator if this is the current room
-            if current_room_id and room_id == current_room_id:
-                # Add a green triangle below the icon
-                triangle_size = room_radius * 0.3
-                triangle_offset = y + room_radius + 5  # Position below the icon
-                triangle_points = f"{x},{triangle_offset-triangle_size} {x-triangle_size},{triangle_offset+triangle_size} {x+triangle_size},{triangle_offset+triangle_size}"
-                svg += f'<polygon points="{triangle_points}" fill="#99FF00" stroke="black" stroke-width="1" />'
-        
-            # Add room name
-            room_name = room.name
-            
-            #add line break to room names
-            y_step = 0
-            y_offset = 0
-            room_word_count = room_name.count(" ")
-
-            #offset the text to the center of the room
-            if room_word_count > 0:
-                y_offset = 14 * (room_word_count -1)
-
-            room_text_output = ""
-            for word in room_name.split(" "):
-            
-                room_text_output += f'<tspan x="{x}" dy="{y_step}px">{word.strip()}</tspan>'
-                y_step = 14
-
-            # Position text below the icon
-            svg += f'<text x="{x}" y="{y + room_radius + 20}" text-anchor="middle" class="text_class">{room_text_output}</text>'
-            
-            
-        svg += '</svg>'
-        return svg 
+            if key == current_key:
+                bottom = y + triangle_bottom
+                triangle_points = f"{x},{y + triangle_top} {x - triangle_size},{bottom} {x + triangle_size},{bottom}"
+                yield _PLAYER_MARKER_SVG.format(points=triangle_points)
+        
+            # Add room name below the icon, one line per word
+            yield _ROOM_LABEL_SVG.format(x=x, y=y + label_offset, tspans=room.name_tspans_for(x))
+        
+        yield '</svg>' 
     
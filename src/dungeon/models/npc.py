@@ -5,9 +5,14 @@ from typing import Any, Optional
 from .character import Character
 from .race import Race
 
+# Races keyed by their string value, for lookups that fall back to HUMAN
+_RACE_BY_VALUE = {race.value: race for race in Race}
+
 class NPC(Character):
     """A non-player character in the dungeon."""
     
+    __slots__ = ('_alias', '_ai_enabled')
+    
     def __init__(
         self,
         name: str,
@@ -65,7 +70,6 @@ class NPC(Character):
             value: True to enable AI, False to disable
         """
         self._ai_enabled = value
-        print(f"DEBUG: AI enabled set to {value} for NPC {self.name}")
     
     @property
     def alias(self) -> Optional[str]:
@@ -83,10 +87,7 @@ class NPC(Character):
         Returns:
             The NPC's race as a Race enum
         """
-        try:
-            return Race(self.race)
-        except ValueError:
-            return Race.HUMAN
+        return _RACE_BY_VALUE.get(self.race, Race.HUMAN)
     
     def to_dict(self) -> dict:
         """Convert the NPC to a dictionary.
@@ -109,12 +110,8 @@ class NPC(Character):
         Returns:
             A new NPC instance
         """
-        race_str = data.get("race", "Human")
-        try:
-            race = Race(race_str)
-        except ValueError:
-            race = Race.HUMAN
-            
+        race = _RACE_BY_VALUE.get(data.get("race", "Human"), Race.HUMAN)
+        
         return cls(
             name=data["name"],
             description=data["description"],
@@ -8,6 +8,8 @@ from .action import Action, ActionType
 class Potion(Item):
     """A potion that can be drunk."""
     
+    __slots__ = ('_effects', '_smell_description')
+    
     def __init__(
         self,
         name: str,
@@ -84,8 +86,7 @@ class Potion(Item):
         Returns:
             Dict containing the potion's attributes
         """
-        return {
-            **super().to_dict(),
-            "effects": self.effects,
-            "smell_description": self.smell_description
-        } 
\ No newline at end of file
+        data = super().to_dict()
+        data["effects"] = self._effects
+        data["smell_description"] = self._smell_description
+        return data 
\ No newline at end of file
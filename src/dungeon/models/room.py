@@ -1,5 +1,6 @@
 """Room model for the dungeon project."""
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 from .base import BaseModel
@@ -10,7 +11,29 @@ from .room_type import RoomType
 from .theme import Theme
 from .trap import Trap
 from .npc import NPC
-from .action import Action, ActionType
+from .action import Action
+
+# Initial letters that take "an" rather than "a" when naming an item
+_VOWELS = frozenset("aeiou")
+
+# Markup around each highlighted item name, with its article
+_A_HIGHLIGHT = "a <span class='console-highlight'>"
+_AN_HIGHLIGHT = "an <span class='console-highlight'>"
+_HIGHLIGHT_END = "</span>"
+
+# Canonical connection keys, so already-normalized directions skip lower()
+_DIRECTION_KEYS = {name: name for name in ("north", "south", "east", "west", "up", "down")}
+
+def _direction_key(direction: str) -> str:
+    """Normalize a direction name for use as a connection key.
+    
+    Args:
+        direction: The direction name, in any case
+        
+    Returns:
+        The lowercase direction name
+    """
+    return _DIRECTION_KEYS.get(direction) or direction.lower()
 
 class RoomLockError(Exception):
     """Exception raised when there are issues with room locking/unlocking."""
@@ -19,6 +42,14 @@ class RoomLockError(Exception):
 class Room(BaseModel):
     """A room in the dungeon."""
     
+    __slots__ = (
+        '_name', '_description', '_theme', '_room_ref_id', '_room_type',
+        '_is_dark', '_is_locked', '_ai_update', '_ai_description',
+        'room_direction_info', '_room_img', '_room_item_location', '_npcs',
+        '_room_items', '_traps', '_room_npcs', '_connections',
+        '_name_tspan_pieces',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -66,12 +97,16 @@ class Room(BaseModel):
         self._room_img = room_img
         self._room_item_location = room_item_location
         
-        # Initialize collections
-        self._npcs: List[Character] = []
-        self._room_items: List[Dict[str, Any]] = []  # List of dicts with Item and room-specific description
+        # Initialize collections. Room's own methods read these attributes
+        # directly; the public properties return copies for outside callers.
+        self._npcs: Dict[UUID, Character] = {}
+        self._room_items: Dict[UUID, Dict[str, Any]] = {}  # Dicts with Item and room-specific description, keyed by item ID
         self._traps: List[Trap] = []
-        self._room_npcs: List[NPC] = []
+        self._room_npcs: Dict[UUID, NPC] = {}
         self._connections: Dict[str, UUID] = {}
+        
+        # Map label markup, built on first render (see name_tspans_for)
+        self._name_tspan_pieces: Optional[List[str]] = None
     
     @property
     def name(self) -> str:
@@ -134,7 +169,15 @@ class Room(BaseModel):
         Returns:
             A copy of the room's NPCs
         """
-        return self._npcs.copy()
+        return list(self._npcs.values())
+    
+    def iter_npcs(self) -> Iterator[Character]:
+        """Iterate over the room's NPCs without copying the list.
+        
+        Returns:
+            An iterator over the room's NPCs
+        """
+        return iter(self._npcs.values())
     
     @property
     def room_items(self) -> List[Dict[str, Any]]:
@@ -143,7 +186,15 @@ class Room(BaseModel):
         Returns:
             List of dictionaries containing items and their room-specific descriptions
         """
-        return self._room_items.copy()
+        return list(self._room_items.values())
+    
+    def iter_room_items(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the items in the room without copying the list.
+        
+        Returns:
+            An iterator over dictionaries containing items and their room-specific descriptions
+        """
+        return iter(self._room_items.values())
     
     @property
     def traps(self) -> List[Trap]:
@@ -154,6 +205,14 @@ class Room(BaseModel):
         """
         return self._traps.copy()
     
+    def iter_traps(self) -> Iterator[Trap]:
+        """Iterate over the room's traps without copying the list.
+        
+        Returns:
+            An iterator over the room's traps
+        """
+        return iter(self._traps)
+    
     @property
     def is_dark(self) -> bool:
         """Get whether the room is dark.
@@ -204,7 +263,7 @@ class Room(BaseModel):
         Args:
             npc: The NPC to add
         """
-        self._npcs.append(npc)
+        self._npcs[npc.id] = npc
     
     def remove_npc(self, npc: Character) -> None:
         """Remove an NPC from the room.
@@ -215,9 +274,7 @@ class Room(BaseModel):
         Raises:
             ValueError: If the NPC is not in the room
         """
-        try:
-            self._npcs.remove(npc)
-        except ValueError:
+        if self._npcs.pop(npc.id, None) is None:
             raise ValueError(f"NPC {npc.name} not found in room")
     
     def add_item(self, item: Item, room_description: str = "") -> None:
@@ -227,10 +284,21 @@ class Room(BaseModel):
             item: The item to add
             room_description: Optional room-specific description of the item
         """
-        self._room_items.append({
+        self._room_items[item.id] = {
             "item": item,
             "item_room_description": room_description
-        })
+        }
+    
+    def add_items(self, items: Iterable[Tuple[Item, str]]) -> None:
+        """Add several items to the room at once.
+        
+        Args:
+            items: Pairs of an item and its room-specific description
+        """
+        self._room_items.update(
+            (item.id, {"item": item, "item_room_description": room_description})
+            for item, room_description in items
+        )
     
     def remove_item(self, item: Item) -> None:
         """Remove an item from the room.
@@ -238,7 +306,7 @@ class Room(BaseModel):
         Args:
             item: The item to remove
         """
-        self._room_items = [item_dict for item_dict in self._room_items if item_dict["item"] != item]
+        self._room_items.pop(item.id, None)
     
     def get_item_room_description(self, item: Item) -> str:
         """Get the room-specific description for an item.
@@ -249,10 +317,10 @@ class Room(BaseModel):
         Returns:
             The room-specific description of the item, or empty string if not found
         """
-        for item_dict in self._room_items:
-            if item_dict["item"] == item:
-                return item_dict["item_room_description"]
-        return ""
+        item_dict = self._room_items.get(item.id)
+        if item_dict is None:
+            return ""
+        return item_dict["item_room_description"]
     
     def set_item_room_description(self, item: Item, description: str) -> None:
         """Set the room-specific description for an item.
@@ -261,10 +329,10 @@ class Room(BaseModel):
             item: The item to set the description for
             description: The new room-specific description
         """
-        for item_dict in self._room_items:
-            if item_dict["item"] == item:
-                item_dict["item_room_description"] = description
-                return
+        item_dict = self._room_items.get(item.id)
+        if item_dict is not None:
+            item_dict["item_room_description"] = description
+            return
         # If item not found, add it with the description
         self.add_item(item, description)
     
@@ -297,7 +365,6 @@ class Room(BaseModel):
     def set_ai_update(self, value: bool) -> None:
         """Set the value of ai_update."""
         self._ai_update = value
-        print(f"DEBUG: ai_update set to {value} for room {self.name}")
     
     def get_ai_description(self) -> str:
         """Get the current value of ai_description."""
@@ -306,7 +373,6 @@ class Room(BaseModel):
     def set_ai_description(self, value: str) -> None:
         """Set the value of ai_description."""
         self._ai_description = value
-        print(f"DEBUG: ai_description set to '{value}' for room {self.name}")
     
     def get_room_direction_info(self) -> str:
         """Get the current value of room_direction_info."""
@@ -345,7 +411,15 @@ class Room(BaseModel):
         Returns:
             List of NPCs in the room
         """
-        return self._room_npcs.copy()
+        return list(self._room_npcs.values())
+    
+    def iter_room_npcs(self) -> Iterator[NPC]:
+        """Iterate over the NPCs in the room without copying the list.
+        
+        Returns:
+            An iterator over the NPCs in the room
+        """
+        return iter(self._room_npcs.values())
     
     def add_npc_npcs(self, npc: NPC) -> None:
         """Add an NPC to the room's NPC list.
@@ -353,7 +427,7 @@ class Room(BaseModel):
         Args:
             npc: The NPC to add
         """
-        self._room_npcs.append(npc)
+        self._room_npcs[npc.id] = npc
     
     def remove_npc_npcs(self, npc: NPC) -> None:
         """Remove an NPC from the room's NPC list.
@@ -361,16 +435,16 @@ class Room(BaseModel):
         Args:
             npc: The NPC to remove
         """
-        self._room_npcs = [n for n in self._room_npcs if n != npc]
+        self._room_npcs.pop(npc.id, None)
     
     @property
-    def connections(self) -> Dict[str, UUID]:
+    def connections(self) -> Mapping[str, UUID]:
         """Get the room's connections.
         
         Returns:
-            Dictionary mapping directions to connected room IDs
+            A read-only view mapping directions to connected room IDs
         """
-        return self._connections.copy()
+        return MappingProxyType(self._connections)
     
     def add_connection(self, direction: str, room_id: UUID) -> None:
         """Add a connection to another room.
@@ -379,7 +453,7 @@ class Room(BaseModel):
             direction: The direction of the connection
             room_id: The ID of the connected room
         """
-        self._connections[direction.lower()] = room_id
+        self._connections[_direction_key(direction)] = room_id
     
     def remove_connection(self, direction: str) -> None:
         """Remove a connection to another room.
@@ -387,7 +461,7 @@ class Room(BaseModel):
         Args:
             direction: The direction of the connection to remove
         """
-        self._connections.pop(direction.lower(), None)
+        self._connections.pop(_direction_key(direction), None)
     
     def get_connected_room_id(self, direction: str) -> Optional[UUID]:
         """Get the ID of the room connected in a specific direction.
@@ -398,7 +472,7 @@ class Room(BaseModel):
         Returns:
             The ID of the connected room, or None if no connection exists
         """
-        return self._connections.get(direction.lower())
+        return self._connections.get(_direction_key(direction))
     
     def handle_room_action(self, action: Action) -> str:
         """Handle a room action.
@@ -409,18 +483,43 @@ class Room(BaseModel):
         Returns:
             A message describing what happened
         """
-        # Check if the action is a room action
-        if Action.get_action_type(action) == ActionType.ROOM:
-            # Handle specific room actions
-            if action == Action.LOOK:
-                return f"{self.description}\n\n{self._get_items_description()}\n\n{self._get_npcs_description()}\n\n{self._get_exits_description()}"
-            elif action == Action.SEARCH:
-                return f"You search the {self.name} thoroughly.\n\n{self._get_items_description()}\n\n{self._get_npcs_description()}"
-            elif action == Action.EXAMINE:
-                return f"You examine the {self.name} carefully.\n\n{self.room_direction_info}\n\n{self._get_items_description()}\n\n{self._get_npcs_description()}\n\n{self._get_exits_description()}"
+        handler = _ROOM_ACTION_HANDLERS.get(action)
+        if handler is not None:
+            return handler(self)
         
         # For non-room actions, return a generic message
-        return f"You can't {action.name.lower()} the {self.name}."
+        return f"You can't {action.name.lower()} the {self._name}."
+    
+    def _describe(self, *heading: str) -> str:
+        """Describe the room's contents below the given heading.
+        
+        Args:
+            *heading: The sections to show before the items, NPCs and exits
+            
+        Returns:
+            All of the sections separated by blank lines
+        """
+        parts = list(heading)
+        parts.append(self.get_items_description())
+        parts.append(self.get_npcs_description())
+        parts.append(self.get_exits_description())
+        return "\n\n".join(parts)
+    
+    def _look_description(self) -> str:
+        """Get the message for looking around the room.
+        
+        Returns:
+            The room's description followed by its items, NPCs and exits
+        """
+        return self._describe(self._description)
+    
+    def _examine_description(self) -> str:
+        """Get the message for examining the room.
+        
+        Returns:
+            The room's direction information followed by its items, NPCs and exits
+        """
+        return self._describe(f"You examine the {self._name} carefully.", self.room_direction_info)
     
     def get_items_description(self) -> str:
         """Get a description of the items in the room.
@@ -432,7 +531,7 @@ class Room(BaseModel):
             return "There's nothing here."
         
         items_desc = []
-        for item_dict in self._room_items:
+        for item_dict in self._room_items.values():
             item = item_dict["item"]
             room_desc = item_dict["item_room_description"]
             if room_desc:
@@ -452,23 +551,16 @@ class Room(BaseModel):
             return ""
         
         items_desc = []
-        for item_dict in self._room_items:
+        for item_dict in self._room_items.values():
             item = item_dict["item"]
-            
-            if len(item.item_type) > 0:
-                item_name = item.item_type
-            else:
-                item_name = item.name
-            # use a, an, or the depending on the item
-            if item_name[0].lower() in ['a', 'e', 'i', 'o', 'u']:
-                items_desc.append("an <span class='console-highlight'>" + item_name + "</span>")
-            else:
-                items_desc.append("a <span class='console-highlight'>" + item_name + "</span>")
+            item_name = item.item_type or item.name
+            # use a or an depending on the item
+            prefix = _AN_HIGHLIGHT if item_name[:1].lower() in _VOWELS else _A_HIGHLIGHT
+            items_desc.append(prefix + item_name + _HIGHLIGHT_END)
         
         if len(items_desc) > 1:
-            last_item = "and " + items_desc.pop()
-            items_desc.append(last_item)
-        return ", ".join(items_desc)
+            return ", ".join(items_desc[:-1]) + ", and " + items_desc[-1]
+        return items_desc[0]
     
     def get_npcs_description(self) -> str:
         """Get a description of the NPCs in the room.
@@ -479,11 +571,7 @@ class Room(BaseModel):
         if not self._room_npcs:
             return ""
         
-        npcs_desc = []
-        for npc in self._room_npcs:
-            npcs_desc.append(npc.name)
-        
-        return "Also here: " + ", ".join(npcs_desc)
+        return "Also here: " + ", ".join([npc.name for npc in self._room_npcs.values()])
     
     def get_exits_description(self) -> str:
         """Get a description of the exits from the room.
@@ -494,11 +582,8 @@ class Room(BaseModel):
         if not self._connections:
             return "There are no obvious exits."
         
-        exits = []
-        for direction in self._connections:
-            exits.append(direction)
-        
-        return "Exits: " + ", ".join(exits)
+        # Iterating the connections yields the direction names directly
+        return "Exits: " + ", ".join(self._connections)
     
 
     def get_room_details(self) -> str:
@@ -516,27 +601,27 @@ class Room(BaseModel):
         if self.get_ai_update():
             room_description = self.get_ai_description()
         else:
-            room_description = self.description
+            room_description = self._description
 
-        if len(self.get_items_names()) > 0:
-            room_items = self.get_items_names()
-            if len(self._room_item_location) > 0:
-                room_item_location = self.room_item_location
+        room_items = self.get_items_names()
+        if room_items:
+            if self._room_item_location:
+                room_item_location = self._room_item_location
                 room_item_description = f"You see {room_item_location} in the room {room_items}."
             else:
                 room_item_description = f"Somewhere in the room you see {room_items}."
         
         #TODO: Add NPCs and exits
         '''
-        if self.room_npcs:
-            room_npcs = self._get_npcs_description()
+        if self._room_npcs:
+            room_npcs = self.get_npcs_description()
 
-        if self.connections:
-            room_exits = self._get_exits_description()
+        if self._connections:
+            room_exits = self.get_exits_description()
         '''
         
 
-        return f"{room_description}\n\n{room_item_description}"
+        return "\n\n".join((room_description, room_item_description))
     
     
     @property
@@ -557,6 +642,29 @@ class Room(BaseModel):
         """
         self._room_item_location = value
     
+    def name_tspans_for(self, x: Any) -> str:
+        """Get the SVG tspan markup for the room's name, one line per word.
+        
+        The markup is built once and cached, since the room's name cannot
+        change; only the x coordinate differs between renders.
+        
+        Args:
+            x: The x coordinate each line of the name is anchored at
+            
+        Returns:
+            The tspan elements for the room's name
+        """
+        if self._name_tspan_pieces is None:
+            # Markup either side of each x attribute value, so it can be filled in with a join
+            pieces = ['<tspan x="']
+            y_step = 0
+            for word in self._name.split():
+                pieces.append(f'" dy="{y_step}px">{word}</tspan><tspan x="')
+                y_step = 14
+            pieces[-1] = pieces[-1][:-len('<tspan x="')]
+            self._name_tspan_pieces = pieces
+        return str(x).join(self._name_tspan_pieces)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the room to a dictionary.
         
@@ -564,29 +672,34 @@ class Room(BaseModel):
             Dict containing the room's attributes
         """
         result = super().to_dict()
-        result.update({
-            "name": self._name,
-            "description": self._description,
-            "theme_id": str(self._theme.id),
-            "room_type_id": str(self._room_type.id) if self._room_type else None,
-            "room_ref_id": self._room_ref_id,
-            "is_dark": self._is_dark,
-            "is_locked": self._is_locked,
-            "npcs": [str(npc.id) for npc in self._npcs],
-            "room_items": [
-                {
-                    "item_id": str(item_dict["item"].id),
-                    "item_room_description": item_dict["item_room_description"]
-                }
-                for item_dict in self._room_items
-            ],
-            "traps": [str(trap.id) for trap in self._traps],
-            "ai_update": self._ai_update,
-            "ai_description": self._ai_description,
-            "room_direction_info": self.room_direction_info,
-            "room_img": self._room_img,
-            "room_npcs": [npc.to_dict() for npc in self._room_npcs],
-            "connections": self.connections,
-            "room_item_location": self._room_item_location,
-        })
-        return result 
\ No newline at end of file
+        result["name"] = self._name
+        result["description"] = self._description
+        result["theme_id"] = self._theme.id_str
+        result["room_type_id"] = self._room_type.id_str if self._room_type else None
+        result["room_ref_id"] = self._room_ref_id
+        result["is_dark"] = self._is_dark
+        result["is_locked"] = self._is_locked
+        result["npcs"] = [npc.id_str for npc in self._npcs.values()]
+        result["room_items"] = [
+            {
+                "item_id": item_dict["item"].id_str,
+                "item_room_description": item_dict["item_room_description"]
+            }
+            for item_dict in self._room_items.values()
+        ]
+        result["traps"] = [trap.id_str for trap in self._traps]
+        result["ai_update"] = self._ai_update
+        result["ai_description"] = self._ai_description
+        result["room_direction_info"] = self.room_direction_info
+        result["room_img"] = self._room_img
+        result["room_npcs"] = [npc.to_dict() for npc in self._room_npcs.values()]
+        result["connections"] = self._connections.copy()
+        result["room_item_location"] = self._room_item_location
+        return result 
+
+
+# Room action handlers, looked up by handle_room_action
+_ROOM_ACTION_HANDLERS: Dict[Action, Callable[[Room], str]] = {
+    Action.LOOK: Room._look_description,
+    Action.EXAMINE: Room._examine_description,
+}
@@ -6,6 +6,8 @@ from .base import BaseModel
 class RoomType(BaseModel):
     """A type of room in the dungeon (e.g., treasure room, boss room, etc.)."""
     
+    __slots__ = ('_name', '_description')
+    
     def __init__(
         self,
         name: str,
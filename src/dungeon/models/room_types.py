@@ -1,43 +1,101 @@
 """Predefined room types for the dungeon project."""
+from typing import Any, Dict, List
+
 from .room_type import RoomType
 
-# Standard room types
-STANDARD_ROOM = RoomType(
-    name="Standard Room",
-    description="A basic room with no special features."
-)
-
-TREASURE_ROOM = RoomType(
-    name="Treasure Room",
-    description="A room containing valuable treasures and items."
-)
-
-BOSS_ROOM = RoomType(
-    name="Boss Room",
-    description="A room containing a powerful boss enemy."
-)
-
-PUZZLE_ROOM = RoomType(
-    name="Puzzle Room",
-    description="A room containing a puzzle that must be solved to proceed."
-)
-
-TRAP_ROOM = RoomType(
-    name="Trap Room",
-    description="A room filled with dangerous traps."
-)
-
-SECRET_ROOM = RoomType(
-    name="Secret Room",
-    description="A hidden room that may contain special rewards."
-)
-
-# List of all available room types
-ALL_ROOM_TYPES = [
-    STANDARD_ROOM,
-    TREASURE_ROOM,
-    BOSS_ROOM,
-    PUZZLE_ROOM,
-    TRAP_ROOM,
-    SECRET_ROOM
-] 
\ No newline at end of file
+__all__ = [
+    "RoomType",
+    "STANDARD_ROOM",
+    "TREASURE_ROOM",
+    "BOSS_ROOM",
+    "PUZZLE_ROOM",
+    "TRAP_ROOM",
+    "SECRET_ROOM",
+    "ALL_ROOM_TYPES",
+    "get_room_type",
+    "get_all_room_types",
+]
+
+# Names and descriptions of the predefined room types
+_ROOM_TYPE_SPECS: Dict[str, str] = {
+    "Standard Room": "A basic room with no special features.",
+    "Treasure Room": "A room containing valuable treasures and items.",
+    "Boss Room": "A room containing a powerful boss enemy.",
+    "Puzzle Room": "A room containing a puzzle that must be solved to proceed.",
+    "Trap Room": "A room filled with dangerous traps.",
+    "Secret Room": "A hidden room that may contain special rewards.",
+}
+
+# Module constants for the predefined room types, mapped to their names
+_ROOM_TYPE_CONSTANTS: Dict[str, str] = {
+    "STANDARD_ROOM": "Standard Room",
+    "TREASURE_ROOM": "Treasure Room",
+    "BOSS_ROOM": "Boss Room",
+    "PUZZLE_ROOM": "Puzzle Room",
+    "TRAP_ROOM": "Trap Room",
+    "SECRET_ROOM": "Secret Room",
+}
+
+# Room types created so far, keyed by name
+_room_type_cache: Dict[str, RoomType] = {}
+
+def get_room_type(name: str) -> RoomType:
+    """Get a predefined room type by name.
+
+    Each room type is created on first use and the same instance is
+    returned on every later call.
+
+    Args:
+        name: The room type's name
+
+    Returns:
+        The room type with the given name
+
+    Raises:
+        KeyError: If there is no predefined room type with that name
+    """
+    room_type = _room_type_cache.get(name)
+    if room_type is None:
+        room_type = RoomType(name=name, description=_ROOM_TYPE_SPECS[name])
+        _room_type_cache[name] = room_type
+    return room_type
+
+def get_all_room_types() -> List[RoomType]:
+    """Get all of the predefined room types.
+
+    Returns:
+        A list of all available room types
+    """
+    return [get_room_type(name) for name in _ROOM_TYPE_SPECS]
+
+def __getattr__(name: str) -> Any:
+    """Resolve the room type constants on first access.
+
+    The value is stored in the module globals, so later accesses skip this
+    hook and always see the same object.
+
+    Args:
+        name: The name of the module attribute
+
+    Returns:
+        The requested room type, or the list of all room types for ALL_ROOM_TYPES
+
+    Raises:
+        AttributeError: If the attribute does not exist
+    """
+    if name in _ROOM_TYPE_CONSTANTS:
+        value = get_room_type(_ROOM_TYPE_CONSTANTS[name])
+    elif name == "ALL_ROOM_TYPES":
+        value = get_all_room_types()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the not yet resolved constants.
+
+    Returns:
+        The sorted attribute names
+    """
+    return sorted(set(globals()) | set(_ROOM_TYPE_CONSTANTS) | {"ALL_ROOM_TYPES"})
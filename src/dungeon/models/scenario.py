@@ -23,13 +23,7 @@ class Scenario(BaseModel):
         Returns:
             A dictionary representation of the scenario
         """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "welcome_message": self.welcome_message,
-            "difficulty": self.difficulty
-        }
+        return self.model_dump()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Scenario':
@@ -41,13 +35,7 @@ class Scenario(BaseModel):
         Returns:
             A new scenario instance
         """
-        return cls(
-            id=data.get("id", str(uuid4())),
-            name=data.get("name", "Default Scenario"),
-            description=data.get("description", "A default scenario"),
-            welcome_message=data.get("welcome_message", "Welcome to the dungeon!"),
-            difficulty=data.get("difficulty", "medium")
-        )
+        return cls.model_validate(data)
     
     def get_name(self) -> str:
         """Get the name of the scenario.
@@ -112,35 +100,3 @@ class Scenario(BaseModel):
             value: The new difficulty
         """
         self.difficulty = value
-    
-    def get_enabled(self) -> bool:
-        """Get whether the scenario is enabled.
-        
-        Returns:
-            True if the scenario is enabled, False otherwise
-        """
-        return self.enabled
-    
-    def set_enabled(self, value: bool) -> None:
-        """Set whether the scenario is enabled.
-        
-        Args:
-            value: True to enable the scenario, False to disable
-        """
-        self.enabled = value
-    
-    def get_filename(self) -> str:
-        """Get the filename of the scenario.
-        
-        Returns:
-            The filename of the scenario
-        """
-        return self.filename
-    
-    def set_filename(self, value: str) -> None:
-        """Set the filename of the scenario.
-        
-        Args:
-            value: The new filename
-        """
-        self.filename = value 
\ No newline at end of file
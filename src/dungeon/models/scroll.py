@@ -8,6 +8,8 @@ from .action import Action, ActionType
 class Scroll(Item):
     """A scroll that can be read."""
     
+    __slots__ = ('_scroll_text',)
+    
     def __init__(
         self,
         name: str,
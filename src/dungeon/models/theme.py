@@ -1,4 +1,5 @@
 """Theme model for the dungeon project."""
+import sys
 from typing import Any, Dict, Optional, Literal
 from uuid import UUID, uuid4
 from enum import Enum
@@ -9,41 +10,59 @@ class ThemeType(Enum):
     INDOOR = "indoor"
     OUTDOOR = "outdoor"
 
+THEME_COLORS = {
+    "farm": "Khaki",
+    "forest": "ForestGreen",
+    "swamp": "DarkOliveGreen",
+    "house": "Peru",
+    "castle": "SlateGray",
+    "graveyard": "Purple",
+    "crypt": "DarkSlateBlue",
+    "mountain": "LightSteelBlue",
+    "plain": "YellowGreen",
+    "desert": "Tan",
+    "sewer": "MediumSeaGreen",
+    "cave": "SaddleBrown"
+}
+
+THEME_ICONS = {
+    "farm": "/static/img/icon/farm_icon.webp",
+    "forest": "/static/img/icon/forest_icon.webp",
+    "swamp": "/static/img/icon/swamp_icon.webp",
+    "house": "/static/img/icon/house_icon.webp",
+    "castle": "/static/img/icon/castle_icon.webp",
+    "graveyard": "/static/img/icon/grave_icon.webp",
+    "crypt": "/static/img/icon/grave_icon.webp",
+    "mountain": "/static/img/icon/mountain_icon.webp",
+    "plain": "/static/img/icon/plain_icon.webp",
+    "desert": "/static/img/icon/desert_icon.webp",
+    "sewer": "/static/img/icon/sewer_icon.webp",
+    "cave": "/static/img/icon/cave_icon.webp",
+    "village": "/static/img/icon/village_icon.webp"
+}
+
+# Fallbacks for theme names without a color or icon of their own
+_DEFAULT_COLOR = sys.intern("Gray")
+_DEFAULT_ICON = sys.intern("/static/img/icon/default_icon.webp")
+
+# (color, icon) for each known theme name, so a theme resolves both with one lookup.
+# The strings are interned, so equal colors and icons compare by identity.
+_THEME_ATTRS = {
+    name: (
+        sys.intern(THEME_COLORS.get(name, _DEFAULT_COLOR)),
+        sys.intern(THEME_ICONS.get(name, _DEFAULT_ICON)),
+    )
+    for name in {**THEME_COLORS, **THEME_ICONS}
+}
+
 class Theme(BaseModel):
     """A theme for a room in the dungeon."""
     
-    THEME_COLORS = {
-        "farm": "Khaki",
-        "forest": "ForestGreen",
-        "swamp": "DarkOliveGreen",
-        "house": "Peru",
-        "castle": "SlateGray",
-        "graveyard": "Purple",
-        "crypt": "DarkSlateBlue",
-        "mountain": "LightSteelBlue",
-        "plain": "YellowGreen",
-        "desert": "Tan",
-        "sewer": "MediumSeaGreen",
-        "cave": "SaddleBrown"
-    }
-
+    __slots__ = ('_name', '_description', '_type', '_music', 'color', '_icon', '_str', '_repr')
     
-
-    THEME_ICONS = {
-        "farm": "/static/img/icon/farm_icon.webp",
-        "forest": "/static/img/icon/forest_icon.webp",
-        "swamp": "/static/img/icon/swamp_icon.webp",
-        "house": "/static/img/icon/house_icon.webp",
-        "castle": "/static/img/icon/castle_icon.webp",
-        "graveyard": "/static/img/icon/grave_icon.webp",
-        "crypt": "/static/img/icon/grave_icon.webp",
-        "mountain": "/static/img/icon/mountain_icon.webp",
-        "plain": "/static/img/icon/plain_icon.webp",
-        "desert": "/static/img/icon/desert_icon.webp",
-        "sewer": "/static/img/icon/sewer_icon.webp",
-        "cave": "/static/img/icon/cave_icon.webp",
-        "village": "/static/img/icon/village_icon.webp"
-    }
+    # Also reachable through the class, as before
+    THEME_COLORS = THEME_COLORS
+    THEME_ICONS = THEME_ICONS
     
     def __init__(
         self,
@@ -67,8 +86,10 @@ class Theme(BaseModel):
         self._description = description
         self._type = theme_type
         self._music = music
-        self.color = self.THEME_COLORS.get(theme_name.lower(), "Gray")  # Default to Gray if theme not found
-        self.icon = self.THEME_ICONS.get(theme_name.lower(), "/static/img/icon/default_icon.webp")  # Default icon if theme not found
+        # color and _icon are left unset until first read; see __getattr__
+        # Built on first str()/repr(); the fields they show never change
+        self._str: Optional[str] = None
+        self._repr: Optional[str] = None
     
     @property
     def name(self) -> str:
@@ -130,18 +151,44 @@ class Theme(BaseModel):
         Returns:
             Dict containing the theme's attributes
         """
-        return {
-            **super().to_dict(),
-            "name": self.name,
-            "description": self.description,
-            "theme_type": self.theme_type,
-            "music": self.music,
-            "icon": self.icon,
-            "color": self.color
-        } 
+        data = super().to_dict()
+        data["name"] = self._name
+        data["description"] = self._description
+        data["theme_type"] = self._type
+        data["music"] = self._music
+        data["icon"] = self._icon
+        data["color"] = self.color
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve color and icon the first time either is read.
+        
+        Only called for attributes that are not set. The resolved value is
+        stored in its slot, so later reads do not come back here.
+        
+        Args:
+            name: The name of the missing attribute
+            
+        Returns:
+            The theme's color or icon file path
+            
+        Raises:
+            AttributeError: For any other missing attribute
+        """
+        if name == "color" or name == "_icon":
+            # Default to Gray and the default icon if the theme is not found
+            color, icon = _THEME_ATTRS.get(self._name.lower(), (_DEFAULT_COLOR, _DEFAULT_ICON))
+            value = color if name == "color" else icon
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __str__(self) -> str:
-        return f"{self.name} ({self.theme_type.value})"
+        if self._str is None:
+            self._str = f"{self._name} ({self._type.value})"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"Theme(theme_name='{self.name}', description='{self.description}', theme_type={self.theme_type}, music='{self.music}')" 
\ No newline at end of file
+        if self._repr is None:
+            self._repr = f"Theme(theme_name='{self._name}', description='{self._description}', theme_type={self._type}, music='{self._music}')"
+        return self._repr 
\ No newline at end of file
@@ -7,6 +7,8 @@ from .base import BaseModel
 class Trap(BaseModel):
     """A trap that can be found in a room."""
     
+    __slots__ = ('_name', '_description', '_damage', 'is_triggered')
+    
     def __init__(
         self,
         name: str,
@@ -27,8 +29,10 @@ class Trap(BaseModel):
         super().__init__(**kwargs)
         self._name = name
         self._description = description
-        self._damage = float(damage)
-        self._is_triggered = bool(is_triggered)
+        # Only convert values that are not already the right type
+        self._damage = damage if type(damage) is float else float(damage)
+        # Plain attribute, coerced once here; trigger() only assigns bools
+        self.is_triggered = is_triggered if type(is_triggered) is bool else bool(is_triggered)
     
     @property
     def name(self) -> str:
@@ -57,34 +61,16 @@ class Trap(BaseModel):
         """
         return self._damage
     
-    @property
-    def is_triggered(self) -> bool:
-        """Get whether the trap has been triggered.
-        
-        Returns:
-            True if the trap has been triggered, False otherwise
-        """
-        return self._is_triggered
-    
-    @is_triggered.setter
-    def is_triggered(self, value: bool) -> None:
-        """Set whether the trap has been triggered.
-        
-        Args:
-            value: True if the trap should be triggered, False otherwise
-        """
-        self._is_triggered = bool(value)
-    
     def trigger(self) -> float:
         """Trigger the trap.
         
         Returns:
             The amount of damage dealt
         """
-        if not self._is_triggered:
-            self._is_triggered = True
-            return self._damage
-        return 0.0
+        if self.is_triggered:
+            return 0.0
+        self.is_triggered = True
+        return self._damage
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the trap to a dictionary.
@@ -92,10 +78,9 @@ class Trap(BaseModel):
         Returns:
             Dict containing the trap's attributes
         """
-        return {
-            **super().to_dict(),
-            "name": self.name,
-            "description": self.description,
-            "damage": self.damage,
-            "is_triggered": self.is_triggered,
-        } 
\ No newline at end of file
+        data = super().to_dict()
+        data["name"] = self._name
+        data["description"] = self._description
+        data["damage"] = self._damage
+        data["is_triggered"] = self.is_triggered
+        return data 
\ No newline at end of file
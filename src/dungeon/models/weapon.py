@@ -1,5 +1,6 @@
 """Weapon model for the dungeon project."""
 from enum import Enum
+from itertools import repeat
 from typing import Optional, Dict, Any, List, Tuple
 
 from .item import Item
@@ -17,6 +18,12 @@ class WeaponError(Exception):
 class Weapon(Item):
     """A weapon that can be used in combat."""
     
+    __slots__ = (
+        '_weapon_type', '_damage_dice', '_num_damage_dice', '_damage_modifier',
+        '_strength_requirement', '_dexterity_requirement', '_range_distance',
+        '_requirements', '_static_dict', '_roll',
+    )
+    
     def __init__(
         self,
         name: str,
@@ -29,7 +36,8 @@ class Weapon(Item):
         dexterity_requirement: int = 0,
         range_distance: Optional[int] = None,
         value: float = 0.0,
-        weight: float = 0.0
+        weight: float = 0.0,
+        detailed_description: str = ""
     ) -> None:
         """Initialize a weapon.
         
@@ -45,6 +53,7 @@ class Weapon(Item):
             range_distance: The range of the weapon (required for ranged weapons)
             value: The monetary value of the weapon
             weight: The weight of the weapon
+            detailed_description: A more detailed description of the weapon
             
         Raises:
             WeaponError: If range_distance is not provided for ranged weapons
@@ -52,20 +61,38 @@ class Weapon(Item):
         super().__init__(
             name=name,
             description=description,
+            detailed_description=detailed_description,
             value=value,
             weight=weight
         )
         
         self._weapon_type = weapon_type
         self._damage_dice = damage_dice
-        self._num_damage_dice = max(1, num_damage_dice)  # Ensure at least 1 die
+        self._roll = damage_dice.roll  # Bound once; every damage roll calls it
+        self._num_damage_dice = num_damage_dice if num_damage_dice >= 1 else 1  # Ensure at least 1 die
         self._damage_modifier = damage_modifier
         self._strength_requirement = strength_requirement
         self._dexterity_requirement = dexterity_requirement
+        # Both requirements in one attribute for can_use
+        self._requirements = (strength_requirement, dexterity_requirement)
         
-        if weapon_type == WeaponType.RANGED and range_distance is None:
+        if range_distance is None and weapon_type is WeaponType.RANGED:
             raise WeaponError("Range distance must be provided for ranged weapons")
         self._range_distance = range_distance
+        
+        # None of these fields change after construction, so to_dict copies
+        # them from here. damage_dice is a placeholder that keeps its key in
+        # place; to_dict fills it in per call.
+        self._static_dict: Dict[str, Any] = {
+            "weapon_type": weapon_type.value,
+            "damage_dice": None,
+            "num_damage_dice": self._num_damage_dice,
+            "damage_modifier": damage_modifier,
+            "strength_requirement": strength_requirement,
+            "dexterity_requirement": dexterity_requirement,
+        }
+        if range_distance is not None:
+            self._static_dict["range_distance"] = range_distance
     
     @property
     def weapon_type(self) -> WeaponType:
@@ -136,7 +163,7 @@ class Weapon(Item):
         Returns:
             The damage dealt
         """
-        return self._damage_dice.roll()
+        return self._roll()
     
     def roll_damage_with_modifier(self, modifier: int = 0) -> int:
         """Roll for damage and add a modifier.
@@ -155,7 +182,9 @@ class Weapon(Item):
         Returns:
             A list of damage values, one for each die
         """
-        return [self._damage_dice.roll() for _ in range(self._num_damage_dice)]
+        # map() drives the loop in C, calling the die's roll once per damage die
+        die = self._damage_dice
+        return list(map(type(die).roll, repeat(die, self._num_damage_dice)))
     
     def roll_total_damage(self, additional_modifier: int = 0) -> Tuple[int, List[int]]:
         """Roll all damage dice and calculate total damage.
@@ -166,10 +195,45 @@ class Weapon(Item):
         Returns:
             A tuple containing (total damage, individual roll results)
         """
+        if self._num_damage_dice == 1:
+            # Single-die weapons skip the roll loop and the sum
+            roll = self._roll()
+            return roll + self._damage_modifier + additional_modifier, [roll]
         rolls = self.roll_multiple_damage()
         total = sum(rolls) + self._damage_modifier + additional_modifier
         return total, rolls
     
+    def roll_total(self, additional_modifier: int = 0) -> int:
+        """Roll all damage dice and return only the total damage.
+        
+        Unlike roll_total_damage, the individual rolls are not kept.
+        
+        Args:
+            additional_modifier: An additional modifier to add to the total
+            
+        Returns:
+            The total damage
+        """
+        total = self._damage_modifier + additional_modifier
+        roll = self._roll
+        for _ in range(self._num_damage_dice):
+            total += roll()
+        return total
+    
+    def simulate_damage(self, num_trials: int) -> List[int]:
+        """Roll total damage many times, e.g. to estimate average damage.
+        
+        Args:
+            num_trials: The number of attacks to simulate
+            
+        Returns:
+            The total damage of each simulated attack
+        """
+        roll = self._roll
+        dice = range(self._num_damage_dice)
+        modifier = self._damage_modifier
+        return [sum([roll() for _ in dice]) + modifier for _ in range(num_trials)]
+    
     def can_use(self, strength: int, dexterity: int) -> bool:
         """Check if a character can use this weapon.
         
@@ -180,10 +244,8 @@ class Weapon(Item):
         Returns:
             True if the character meets the requirements
         """
-        return (
-            strength >= self._strength_requirement and
-            dexterity >= self._dexterity_requirement
-        )
+        min_strength, min_dexterity = self._requirements
+        return strength >= min_strength and dexterity >= min_dexterity
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the weapon to a dictionary.
@@ -191,17 +253,7 @@ class Weapon(Item):
         Returns:
             Dict containing the weapon's attributes
         """
-        weapon_dict = {
-            **super().to_dict(),
-            "weapon_type": self.weapon_type.value,
-            "damage_dice": self.damage_dice.to_dict(),
-            "num_damage_dice": self.num_damage_dice,
-            "damage_modifier": self.damage_modifier,
-            "strength_requirement": self.strength_requirement,
-            "dexterity_requirement": self.dexterity_requirement
-        }
-        
-        if self.range_distance is not None:
-            weapon_dict["range_distance"] = self.range_distance
-            
-        return weapon_dict 
\ No newline at end of file
+        data = super().to_dict()
+        data.update(self._static_dict)
+        data["damage_dice"] = self._damage_dice.to_dict()
+        return data 
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Shared pytest configuration and fixtures for the dungeon tests."""
+import pytest
+
+from dungeon.models.item import Item
+from dungeon.models.theme import Theme
+
+# Constructor arguments for the shared test items
+SWORD_KW = dict(
+    name="Sword",
+    description="A sharp sword",
+    detailed_description="A sharp sword with a worn leather grip",
+    value=10.0,
+    weight=5.0
+)
+SHIELD_KW = dict(
+    name="Shield",
+    description="A sturdy shield",
+    detailed_description="A sturdy oak shield bound in iron",
+    value=5.0,
+    weight=8.0
+)
+
+
+def pytest_configure(config):
+    """Register the markers used by the test modules."""
+    config.addinivalue_line(
+        "markers",
+        "fast: pure model tests with no I/O or shared state, safe to run in parallel "
+        "(e.g. pytest -m fast -n auto --dist loadfile with pytest-xdist)"
+    )
+
+
+@pytest.fixture(scope="session")
+def sword():
+    """Create a test sword item."""
+    return Item(**SWORD_KW)
+
+
+@pytest.fixture(scope="session")
+def shield():
+    """Create a test shield item."""
+    return Item(**SHIELD_KW)
+
+
+@pytest.fixture(scope="session")
+def theme():
+    """Create a test theme."""
+    return Theme(
+        theme_name="Test Theme",
+        description="A test theme"
+    )
@@ -1,9 +1,36 @@
 """Tests for the Character model."""
+from contextlib import nullcontext
 from decimal import Decimal
 import pytest
 
 from dungeon.models.character import Character, Alignment
-from dungeon.models.item import Item
+
+pytestmark = pytest.mark.fast
+
+# Hit point values shared by the tests below
+HP_0 = Decimal("0")
+HP_50 = Decimal("50")
+HP_50F = Decimal("50.0")
+HP_75 = Decimal("75")
+HP_100 = Decimal("100")
+HP_NEG1 = Decimal("-1")
+HP_101 = Decimal("101")
+
+# Valid constructor arguments for characters built inside tests
+_CHARACTER_DEFAULTS = dict(
+    name="Test",
+    description="Test",
+    hit_points=HP_50,
+    dexterity=10,
+    intelligence=10,
+    strength=10
+)
+
+def make_char(**overrides):
+    """Create a character from the test defaults, overriding some arguments."""
+    kwargs = _CHARACTER_DEFAULTS.copy()
+    kwargs.update(overrides)
+    return Character(**kwargs)
 
 @pytest.fixture
 def character():
@@ -11,44 +38,31 @@ def character():
     return Character(
         name="Test Character",
         description="A test character",
-        hit_points=Decimal("50.0"),
+        hit_points=HP_50F,
         dexterity=10,
         intelligence=10,
         strength=10
     )
 
 @pytest.fixture
-def sword():
-    """Create a test sword."""
-    return Item(
-        name="Sword",
-        description="A sharp sword",
-        value=10.0,
-        weight=5.0
-    )
-
-@pytest.fixture
-def shield():
-    """Create a test shield."""
-    return Item(
-        name="Shield",
-        description="A sturdy shield",
-        value=5.0,
-        weight=8.0
-    )
+def equipped_character(character, sword, shield):
+    """Create a test character carrying the sword and the shield."""
+    character.add_to_inventory(sword)
+    character.add_to_inventory(shield)
+    return character
 
 def test_character_initialization(character):
     """Test character initialization."""
     assert character.name == "Test Character"
     assert character.description == "A test character"
-    assert character.hit_points == Decimal("50.0")
+    assert character.hit_points == HP_50F
     assert character.dexterity == 10
     assert character.intelligence == 10
     assert character.strength == 10
     assert character.gender == "unknown"
     assert character.race == "unknown"
     assert character.alignment == Alignment.TRUE_NEUTRAL
-    assert character.items == []
+    assert character.inventory == []
 
 def test_character_immutable_attributes(character):
     """Test that certain character attributes are immutable."""
@@ -60,86 +74,61 @@ def test_character_immutable_attributes(character):
 
 def test_character_hit_points_validation(character):
     """Test hit points validation."""
-    character.hit_points = Decimal("75")
-    assert character.hit_points == Decimal("75")
-    
-    with pytest.raises(ValueError):
-        character.hit_points = Decimal("-1")
-    
+    character.hit_points = HP_75
+    assert character.hit_points == HP_75
+
+@pytest.mark.parametrize("bad_hit_points", [HP_NEG1, HP_101])
+def test_character_hit_points_rejected(character, bad_hit_points):
+    """Test that setting out-of-range hit points is rejected."""
     with pytest.raises(ValueError):
-        character.hit_points = Decimal("101")
+        character.hit_points = bad_hit_points
 
-def test_character_attribute_validation():
+@pytest.mark.parametrize("overrides", [
+    {"dexterity": 0},
+    {"intelligence": 21},
+    {"strength": -1},
+])
+def test_character_attribute_validation(overrides):
     """Test validation of character attributes."""
     with pytest.raises(ValueError):
-        Character(
-            name="Test",
-            description="Test",
-            hit_points=Decimal("50"),
-            dexterity=0,
-            intelligence=10,
-            strength=10
-        )
-    
-    with pytest.raises(ValueError):
-        Character(
-            name="Test",
-            description="Test",
-            hit_points=Decimal("50"),
-            dexterity=10,
-            intelligence=21,
-            strength=10
-        )
-    
-    with pytest.raises(ValueError):
-        Character(
-            name="Test",
-            description="Test",
-            hit_points=Decimal("50"),
-            dexterity=10,
-            intelligence=10,
-            strength=-1
-        )
+        make_char(**overrides)
 
 def test_character_items(character, sword, shield):
     """Test character item management."""
-    character.add_item(sword)
-    assert len(character.items) == 1
-    assert character.items[0] == sword
+    character.add_to_inventory(sword)
+    assert len(character.inventory) == 1
+    assert character.inventory[0] == sword
     
-    character.add_item(shield)
-    assert len(character.items) == 2
-    assert character.items[1] == shield
+    character.add_to_inventory(shield)
+    assert len(character.inventory) == 2
+    assert character.inventory[1] == shield
     
-    character.remove_item(sword)
-    assert len(character.items) == 1
-    assert character.items[0] == shield
+    character.remove_from_inventory(sword)
+    assert len(character.inventory) == 1
+    assert character.inventory[0] == shield
     
     with pytest.raises(ValueError):
-        character.remove_item(sword)
+        character.remove_from_inventory(sword)
 
-def test_character_alignment(character):
-    """Test character alignment."""
-    # Test default alignment
+def test_character_default_alignment(character):
+    """Test character default alignment."""
     assert character.alignment == Alignment.TRUE_NEUTRAL
-    
-    # Test setting valid alignments
-    character.alignment = Alignment.LAWFUL_GOOD
-    assert character.alignment == Alignment.LAWFUL_GOOD
-    
-    character.alignment = Alignment.CHAOTIC_EVIL
-    assert character.alignment == Alignment.CHAOTIC_EVIL
-    
-    # Test setting invalid alignment
-    with pytest.raises(ValueError):
-        character.alignment = "Invalid Alignment"
 
-def test_character_to_dict(character, sword, shield):
+@pytest.mark.parametrize("alignment, ok", [
+    (Alignment.LAWFUL_GOOD, True),
+    (Alignment.CHAOTIC_EVIL, True),
+    ("Invalid Alignment", False),
+])
+def test_character_alignment(character, alignment, ok):
+    """Test setting character alignment."""
+    with nullcontext() if ok else pytest.raises(ValueError):
+        character.alignment = alignment
+    if ok:
+        assert character.alignment == alignment
+
+def test_character_to_dict(equipped_character, sword, shield):
     """Test character serialization."""
-    character.add_item(sword)
-    character.add_item(shield)
-    
-    data = character.to_dict()
+    data = equipped_character.to_dict()
     assert data["name"] == "Test Character"
     assert data["description"] == "A test character"
     assert data["hit_points"] == 50.0
@@ -149,92 +138,35 @@ def test_character_to_dict(character, sword, shield):
     assert data["gender"] == "unknown"
     assert data["race"] == "unknown"
     assert data["alignment"] == "True Neutral"
-    assert len(data["items"]) == 2
-    assert data["items"][0]["name"] == "Sword"
-    assert data["items"][1]["name"] == "Shield"
+    # Items are serialized in the order they were added
+    assert len(data["inventory"]) == 2
+    for item_data, item in zip(data["inventory"], (sword, shield)):
+        for field in ("name", "description", "value", "weight"):
+            assert item_data[field] == getattr(item, field)
 
-def test_hit_points_validation():
+@pytest.mark.parametrize("hit_points, ok", [
+    (HP_0, True),
+    (HP_100, True),
+    (HP_NEG1, False),
+    (HP_101, False),
+])
+def test_hit_points_validation(hit_points, ok):
     """Test hit points validation."""
-    # Valid hit points values
-    Character(
-        name="Test",
-        description="Test",
-        hit_points=Decimal("0"),
-        dexterity=10,
-        intelligence=10,
-        strength=10
-    )
-    Character(
-        name="Test",
-        description="Test",
-        hit_points=Decimal("100"),
-        dexterity=10,
-        intelligence=10,
-        strength=10
-    )
-    
-    # Invalid hit points values
-    with pytest.raises(ValueError):
-        Character(
-            name="Test",
-            description="Test",
-            hit_points=Decimal("-1"),
-            dexterity=10,
-            intelligence=10,
-            strength=10
-        )
-    
-    with pytest.raises(ValueError):
-        Character(
-            name="Test",
-            description="Test",
-            hit_points=Decimal("101"),
-            dexterity=10,
-            intelligence=10,
-            strength=10
-        )
+    with nullcontext() if ok else pytest.raises(ValueError):
+        make_char(hit_points=hit_points)
 
 def test_attribute_validation():
     """Test validation for dexterity, intelligence, and strength."""
     # Valid values
-    Character(
-        name="Test",
-        description="Test",
-        hit_points=Decimal("50"),
-        dexterity=1,
-        intelligence=1,
-        strength=1
-    )
-    Character(
-        name="Test",
-        description="Test",
-        hit_points=Decimal("50"),
-        dexterity=20,
-        intelligence=20,
-        strength=20
-    )
-    
-    # Invalid values
-    for attr in ["dexterity", "intelligence", "strength"]:
-        with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
-            Character(
-                name="Test",
-                description="Test",
-                hit_points=Decimal("50"),
-                dexterity=0 if attr == "dexterity" else 10,
-                intelligence=0 if attr == "intelligence" else 10,
-                strength=0 if attr == "strength" else 10
-            )
-        
-        with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
-            Character(
-                name="Test",
-                description="Test",
-                hit_points=Decimal("50"),
-                dexterity=21 if attr == "dexterity" else 10,
-                intelligence=21 if attr == "intelligence" else 10,
-                strength=21 if attr == "strength" else 10
-            )
+    make_char(dexterity=1, intelligence=1, strength=1)
+    make_char(dexterity=20, intelligence=20, strength=20)
+
+@pytest.mark.parametrize("attr", ["dexterity", "intelligence", "strength"])
+@pytest.mark.parametrize("bad_value", [0, 21])
+def test_attribute_out_of_range(attr, bad_value):
+    """Test that out-of-range dexterity, intelligence, and strength are rejected."""
+    with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
+        make_char(**{attr: bad_value})
 
 def test_attribute_setters(character):
     """Test setters for dexterity, intelligence, and strength."""
@@ -247,37 +179,10 @@ def test_attribute_setters(character):
     
     character.strength = 15
     assert character.strength == 15
-    
-    # Test invalid values
-    for attr, setter in [
-        ("dexterity", character.dexterity),
-        ("intelligence", character.intelligence),
-        ("strength", character.strength)
-    ]:
-        with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
-            setattr(character, attr, 0)
-        
-        with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
-            setattr(character, attr, 21)
 
-def test_to_dict_with_items(character, sword, shield):
-    """Test to_dict method with items."""
-    character.add_item(sword)
-    character.add_item(shield)
-    
-    char_dict = character.to_dict()
-    
-    assert "items" in char_dict
-    assert len(char_dict["items"]) == 2
-    
-    # Check first item
-    assert char_dict["items"][0]["name"] == "Sword"
-    assert char_dict["items"][0]["description"] == "A sharp sword"
-    assert char_dict["items"][0]["value"] == 10.0
-    assert char_dict["items"][0]["weight"] == 5.0
-    
-    # Check second item
-    assert char_dict["items"][1]["name"] == "Shield"
-    assert char_dict["items"][1]["description"] == "A sturdy shield"
-    assert char_dict["items"][1]["value"] == 5.0
-    assert char_dict["items"][1]["weight"] == 8.0 
\ No newline at end of file
+@pytest.mark.parametrize("attr", ["dexterity", "intelligence", "strength"])
+@pytest.mark.parametrize("bad_value", [0, 21])
+def test_attribute_setter_out_of_range(character, attr, bad_value):
+    """Test that setting out-of-range dexterity, intelligence, and strength is rejected."""
+    with pytest.raises(ValueError, match=f"{attr.capitalize()} must be between 1 and 20"):
+        setattr(character, attr, bad_value)
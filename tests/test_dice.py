@@ -1,54 +1,44 @@
 """Tests for the Dice model."""
+import random
 import pytest
-from unittest.mock import patch
 
 from dungeon.models.dice import Dice, DiceError
 
-@pytest.fixture
-def d4():
-    """Create a test d4."""
-    return Dice(sides=4)
+pytestmark = pytest.mark.fast
+
+class _FakeRng:
+    """Stand-in RNG that returns preset rolls and records the ranges asked for."""
+    
+    def __init__(self, *values):
+        self._values = iter(values)
+        self.calls = []
+    
+    def randint(self, a, b):
+        self.calls.append((a, b))
+        return next(self._values)
 
 @pytest.fixture
 def d6():
     """Create a test d6."""
     return Dice(sides=6)
 
-@pytest.fixture
-def d20():
-    """Create a test d20."""
-    return Dice(sides=20)
+@pytest.mark.parametrize("sides", sorted(Dice.VALID_SIDES))
+def test_dice_valid_sides(sides):
+    """Test dice initialization with each valid number of sides."""
+    assert Dice(sides=sides).sides == sides
 
-def test_dice_initialization():
-    """Test dice initialization."""
-    # Test valid dice
-    for sides in Dice.VALID_SIDES:
-        dice = Dice(sides=sides)
-        assert dice.sides == sides
-    
-    # Test invalid dice
+def test_dice_invalid_sides():
+    """Test that an invalid number of sides is rejected."""
     with pytest.raises(DiceError, match="Invalid number of sides"):
         Dice(sides=7)
 
-def test_dice_roll_range(d4, d6, d20):
+@pytest.mark.parametrize("sides, value", [(4, 3), (6, 4), (20, 15)])
+def test_dice_roll_range(sides, value):
     """Test that dice rolls are within valid ranges."""
-    # Test d4
-    with patch('random.randint') as mock_randint:
-        mock_randint.return_value = 3
-        assert d4.roll() == 3
-        mock_randint.assert_called_with(1, 4)
-    
-    # Test d6
-    with patch('random.randint') as mock_randint:
-        mock_randint.return_value = 4
-        assert d6.roll() == 4
-        mock_randint.assert_called_with(1, 6)
-    
-    # Test d20
-    with patch('random.randint') as mock_randint:
-        mock_randint.return_value = 15
-        assert d20.roll() == 15
-        mock_randint.assert_called_with(1, 20)
+    rng = _FakeRng(value)
+    dice = Dice(sides=sides, rng=rng)
+    assert dice.roll() == value
+    assert rng.calls == [(1, sides)]
 
 def test_roll_multiple():
     """Test rolling multiple dice."""
@@ -65,28 +55,23 @@ def test_roll_multiple():
     with pytest.raises(DiceError, match="Invalid number of sides"):
         Dice.roll_multiple(num_dice=2, sides=7)
 
-def test_roll_with_modifier():
+@pytest.mark.parametrize("rolls, modifier, expected", [
+    ((4, 5, 6), 2, 17),   # 4 + 5 + 6 + 2
+    ((1, 2, 3), -1, 5),   # 1 + 2 + 3 - 1
+    ((3, 3, 3), 0, 9),    # 3 + 3 + 3 + 0
+])
+def test_roll_with_modifier(rolls, modifier, expected):
     """Test rolling dice with a modifier."""
-    # Test with positive modifier
-    with patch('random.randint') as mock_randint:
-        mock_randint.side_effect = [4, 5, 6]
-        result = Dice.roll_with_modifier(num_dice=3, sides=6, modifier=2)
-        assert result == 17  # 4 + 5 + 6 + 2
-        assert mock_randint.call_count == 3
-    
-    # Test with negative modifier
-    with patch('random.randint') as mock_randint:
-        mock_randint.side_effect = [1, 2, 3]
-        result = Dice.roll_with_modifier(num_dice=3, sides=6, modifier=-1)
-        assert result == 5  # 1 + 2 + 3 - 1
-        assert mock_randint.call_count == 3
-    
-    # Test with zero modifier
-    with patch('random.randint') as mock_randint:
-        mock_randint.side_effect = [3, 3, 3]
-        result = Dice.roll_with_modifier(num_dice=3, sides=6, modifier=0)
-        assert result == 9  # 3 + 3 + 3 + 0
-        assert mock_randint.call_count == 3
+    rng = _FakeRng(*rolls)
+    result = Dice.roll_with_modifier(num_dice=3, sides=6, modifier=modifier, rng=rng)
+    assert result == expected
+    assert len(rng.calls) == 3
+
+def test_seeded_rolls_are_repeatable():
+    """Test that dice with equally seeded RNGs roll the same values."""
+    first = Dice.roll_multiple(num_dice=5, sides=20, rng=random.Random(42))
+    second = Dice.roll_multiple(num_dice=5, sides=20, rng=random.Random(42))
+    assert first == second
 
 def test_to_dict(d6):
     """Test dice serialization."""
@@ -1,27 +1,10 @@
 """Tests for the Item model."""
+from contextlib import nullcontext
 import pytest
 
 from dungeon.models.item import Item
 
-@pytest.fixture
-def sword():
-    """Create a test sword item."""
-    return Item(
-        name="Sword",
-        description="A sharp sword",
-        value=10.0,
-        weight=5.0
-    )
-
-@pytest.fixture
-def shield():
-    """Create a test shield item."""
-    return Item(
-        name="Shield",
-        description="A sturdy shield",
-        value=5.0,
-        weight=8.0
-    )
+pytestmark = pytest.mark.fast
 
 def test_item_initialization(sword):
     """Test item initialization."""
@@ -30,38 +13,32 @@ def test_item_initialization(sword):
     assert sword.value == 10.0
     assert sword.weight == 5.0
 
-def test_weight_validation():
+@pytest.mark.parametrize("weight, ok", [(0.0, True), (10.0, True), (-1.0, False)])
+def test_weight_validation(weight, ok):
     """Test weight validation."""
-    # Valid weight values
-    Item(
-        name="Test",
-        description="Test",
-        value=10.0,
-        weight=0.0
-    )
-    Item(
-        name="Test",
-        description="Test",
-        value=10.0,
-        weight=10.0
-    )
-    
-    # Invalid weight values
-    with pytest.raises(ValueError, match="Weight must be non-negative"):
+    with nullcontext() if ok else pytest.raises(ValueError, match="Weight must be non-negative"):
         Item(
             name="Test",
             description="Test",
+            detailed_description="Test",
             value=10.0,
-            weight=-1.0
+            weight=weight
         )
 
-def test_weight_setter(sword):
+def test_weight_setter():
     """Test weight setter."""
-    sword.weight = 7.0
-    assert sword.weight == 7.0
+    item = Item(
+        name="Test",
+        description="Test",
+        detailed_description="Test",
+        value=10.0,
+        weight=5.0
+    )
+    item.weight = 7.0
+    assert item.weight == 7.0
     
     with pytest.raises(ValueError, match="Weight must be non-negative"):
-        sword.weight = -1.0
+        item.weight = -1.0
 
 def test_to_dict(sword):
     """Test to_dict method."""
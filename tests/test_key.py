@@ -6,7 +6,9 @@ from dungeon.models.key import Key
 from dungeon.models.room import Room, RoomLockError
 from dungeon.models.theme import Theme
 
-@pytest.fixture
+pytestmark = pytest.mark.fast
+
+@pytest.fixture(scope="session")
 def theme():
     """Create a test theme."""
     return Theme(
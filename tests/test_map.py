@@ -1,46 +1,33 @@
 """Tests for the Map model."""
 from decimal import Decimal
+from uuid import uuid4
 import pytest
 
 from dungeon.models.direction import Direction
 from dungeon.models.map import Map
 from dungeon.models.room import Room
-from dungeon.models.theme import Theme
 
-@pytest.fixture
-def theme():
-    """Create a test theme."""
-    return Theme(
-        name="Test Theme",
-        description="A test theme"
-    )
+pytestmark = pytest.mark.fast
 
-@pytest.fixture
-def room1(theme):
-    """Create the first test room."""
-    return Room(
-        description="Room 1",
-        theme=theme,
-        is_dark=False
-    )
+# Directions used throughout, bound once
+NORTH, SOUTH, EAST, WEST = Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST
 
-@pytest.fixture
-def room2(theme):
-    """Create the second test room."""
-    return Room(
-        description="Room 2",
-        theme=theme,
-        is_dark=True
-    )
+# (description, is_dark) of the rooms the tests build
+ROOM_1 = ("Room 1", False)
+ROOM_2 = ("Room 2", True)
+ROOM_3 = ("Room 3", False)
 
 @pytest.fixture
-def room3(theme):
-    """Create the third test room."""
-    return Room(
-        description="Room 3",
-        theme=theme,
-        is_dark=False
-    )
+def rooms(request, theme):
+    """Create the test rooms listed by indirect parametrization.
+    
+    Returns:
+        One room per (description, is_dark) pair in request.param
+    """
+    return [
+        Room(description=description, theme=theme, is_dark=is_dark)
+        for description, is_dark in request.param
+    ]
 
 @pytest.fixture
 def dungeon_map():
@@ -51,8 +38,10 @@ def test_map_initialization(dungeon_map):
     """Test map initialization."""
     assert dungeon_map.rooms == []
 
-def test_add_remove_room(dungeon_map, room1):
+@pytest.mark.parametrize("rooms", [[ROOM_1]], indirect=True)
+def test_add_remove_room(dungeon_map, rooms):
     """Test adding and removing rooms."""
+    room1, = rooms
     # Add room
     dungeon_map.add_room(room1)
     assert len(dungeon_map.rooms) == 1
@@ -66,78 +55,139 @@ def test_add_remove_room(dungeon_map, room1):
     with pytest.raises(KeyError):
         dungeon_map.remove_room(room1.id)
 
-def test_connect_disconnect_rooms(dungeon_map, room1, room2):
+def _ref_room(theme, name, room_ref_id):
+    """Create a room with the given name and reference ID."""
+    return Room(name=name, description=name, theme=theme, room_ref_id=room_ref_id)
+
+def test_ref_id_lookup_after_remove(dungeon_map, theme):
+    """Test that removing a room leaves later rooms with its ref ID findable."""
+    first = _ref_room(theme, "First", "r")
+    second = _ref_room(theme, "Second", "r")
+    dungeon_map.add_room(first)
+    dungeon_map.add_room(second)
+    assert dungeon_map.get_room_by_ref_id("r") is first
+    
+    dungeon_map.remove_room(first.id)
+    assert dungeon_map.get_room_by_ref_id("r") is second
+    
+    dungeon_map.remove_room(second.id)
+    assert dungeon_map.get_room_by_ref_id("r") is None
+
+def test_ref_id_lookup_after_replace(dungeon_map, theme):
+    """Test that replacing a room under its ID updates the ref ID lookup."""
+    original = _ref_room(theme, "Original", "r")
+    other = _ref_room(theme, "Other", "r")
+    dungeon_map.add_room(original)
+    dungeon_map.add_room(other)
+    
+    # A room with the same ID but a new ref ID takes the original's place
+    replacement = _ref_room(theme, "Replacement", "s")
+    replacement._id = original.id
+    dungeon_map.add_room(replacement)
+    assert dungeon_map.get_room_by_ref_id("r") is other
+    assert dungeon_map.get_room_by_ref_id("s") is replacement
+    assert original not in dungeon_map.get_all_rooms()
+
+def test_from_dict_matches_ids_by_value(theme):
+    """Test that from_dict resolves differently spelled IDs and skips unknown ones."""
+    first = _ref_room(theme, "First", "a")
+    second = _ref_room(theme, "Second", "b")
+    room_objects = {first.id_str: first, second.id_str: second}
+    data = {
+        "connections": {
+            first.id_str.upper(): {NORTH: second.id.hex},
+            second.id_str: {SOUTH: first.id_str, EAST: str(uuid4())},
+            "not-a-uuid": {WEST: first.id_str},
+        },
+        "visited_rooms": [second.id.hex.upper(), str(uuid4())],
+    }
+    
+    dungeon_map = Map.from_dict(data, room_objects)
+    assert dungeon_map.get_connected_room(first.id, NORTH) is second
+    assert dungeon_map.get_connected_room(second.id, SOUTH) is first
+    assert dungeon_map.get_connected_room(second.id, EAST) is None
+    assert dungeon_map.get_visited_rooms() == [second]
+
+@pytest.mark.parametrize("rooms", [[ROOM_1, ROOM_2]], indirect=True)
+def test_connect_disconnect_rooms(dungeon_map, rooms):
     """Test connecting and disconnecting rooms."""
+    room1, room2 = rooms
     # Add rooms
     dungeon_map.add_room(room1)
     dungeon_map.add_room(room2)
     
     # Connect rooms
-    dungeon_map.connect_rooms(room1, room2, Direction.NORTH)
+    dungeon_map.connect_rooms(room1, room2, NORTH)
     
     # Check connections
-    assert dungeon_map.get_connected_room(room1, Direction.NORTH) == room2
-    assert dungeon_map.get_connected_room(room2, Direction.SOUTH) == room1
+    assert dungeon_map.get_connected_room(room1, NORTH) == room2
+    assert dungeon_map.get_connected_room(room2, SOUTH) == room1
     
     # Disconnect rooms
-    dungeon_map.disconnect_rooms(room1, room2, Direction.NORTH)
+    dungeon_map.disconnect_rooms(room1, room2, NORTH)
     
     # Check connections are removed
-    assert dungeon_map.get_connected_room(room1, Direction.NORTH) is None
-    assert dungeon_map.get_connected_room(room2, Direction.SOUTH) is None
+    assert dungeon_map.get_connected_room(room1, NORTH) is None
+    assert dungeon_map.get_connected_room(room2, SOUTH) is None
     
     # Try to disconnect non-existent connection
     with pytest.raises(KeyError):
-        dungeon_map.disconnect_rooms(room1, room2, Direction.NORTH)
+        dungeon_map.disconnect_rooms(room1, room2, NORTH)
 
-def test_get_available_directions(dungeon_map, room1, room2, room3):
+@pytest.mark.parametrize("rooms", [[ROOM_1, ROOM_2, ROOM_3]], indirect=True)
+def test_get_available_directions(dungeon_map, rooms):
     """Test getting available directions."""
+    room1, room2, room3 = rooms
     # Add rooms
     dungeon_map.add_room(room1)
     dungeon_map.add_room(room2)
     dungeon_map.add_room(room3)
     
     # Connect rooms
-    dungeon_map.connect_rooms(room1, room2, Direction.NORTH)
-    dungeon_map.connect_rooms(room1, room3, Direction.EAST)
+    dungeon_map.connect_rooms(room1, room2, NORTH)
+    dungeon_map.connect_rooms(room1, room3, EAST)
     
     # Check available directions
     directions = dungeon_map.get_available_directions(room1)
     assert len(directions) == 2
-    assert Direction.NORTH in directions
-    assert Direction.EAST in directions
+    assert NORTH in directions
+    assert EAST in directions
     
     # Check room with no connections
-    assert dungeon_map.get_available_directions(room3) == [Direction.WEST]
+    assert dungeon_map.get_available_directions(room3) == [WEST]
 
-def test_find_path(dungeon_map, room1, room2, room3):
+@pytest.mark.parametrize("rooms", [[ROOM_1, ROOM_2, ROOM_3]], indirect=True)
+def test_find_path(dungeon_map, rooms):
     """Test finding paths between rooms."""
+    room1, room2, room3 = rooms
     # Add rooms
     dungeon_map.add_room(room1)
     dungeon_map.add_room(room2)
     dungeon_map.add_room(room3)
     
     # Connect rooms in a chain: room1 -> room2 -> room3
-    dungeon_map.connect_rooms(room1, room2, Direction.NORTH)
-    dungeon_map.connect_rooms(room2, room3, Direction.EAST)
+    dungeon_map.connect_rooms(room1, room2, NORTH)
+    dungeon_map.connect_rooms(room2, room3, EAST)
     
     # Find path from room1 to room3
     path = dungeon_map.find_path(room1, room3)
     assert path is not None
     assert len(path) == 2
-    assert path[0] == (room2, Direction.NORTH)
-    assert path[1] == (room3, Direction.EAST)
+    assert path[0] == (room2, NORTH)
+    assert path[1] == (room3, EAST)
     
     # Find path to disconnected room
     dungeon_map.remove_room(room2)
     assert dungeon_map.find_path(room1, room3) is None
 
-def test_to_dict(dungeon_map, room1, room2):
+@pytest.mark.parametrize("rooms", [[ROOM_1, ROOM_2]], indirect=True)
+def test_to_dict(dungeon_map, rooms):
     """Test map to_dict method."""
+    room1, room2 = rooms
     # Add and connect rooms
     dungeon_map.add_room(room1)
     dungeon_map.add_room(room2)
-    dungeon_map.connect_rooms(room1, room2, Direction.NORTH)
+    dungeon_map.connect_rooms(room1, room2, NORTH)
     
     # Convert to dict
     map_dict = dungeon_map.to_dict()
@@ -151,7 +201,7 @@ def test_to_dict(dungeon_map, room1, room2):
     # Check connection details
     connection = next(
         c for c in map_dict["connections"]
-        if c["direction"] == Direction.NORTH.name
+        if c["direction"] == NORTH.name
     )
     assert connection["source_id"] == str(room1.id)
     assert connection["target_id"] == str(room2.id) 
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Tests for the key-related methods in the Map class."""
+from types import SimpleNamespace
 from uuid import uuid4
 import pytest
 
@@ -6,29 +7,24 @@ from dungeon.models.direction import Direction
 from dungeon.models.key import Key
 from dungeon.models.map import Map
 from dungeon.models.room import Room
-from dungeon.models.theme import Theme
 
-@pytest.fixture
-def theme():
-    """Create a test theme."""
-    return Theme(
-        name="Test Theme",
-        description="A test theme"
-    )
+pytestmark = pytest.mark.fast
 
-@pytest.fixture
-def locked_room(theme):
-    """Create a locked room."""
-    return Room(
+# Directions used throughout, bound once
+NORTH, SOUTH, EAST, WEST = Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST
+
+def _build_key_map(theme):
+    """Build a map with a locked room and a connected room holding its key.
+    
+    Returns:
+        A namespace with the map, locked_room, key_room and key
+    """
+    locked_room = Room(
         description="Locked Room",
         theme=theme,
         is_locked=True
     )
-
-@pytest.fixture
-def key_room(theme, locked_room):
-    """Create a room containing a key."""
-    room = Room(
+    key_room = Room(
         description="Room with Key",
         theme=theme
     )
@@ -37,57 +33,72 @@ def key_room(theme, locked_room):
         description="A test key",
         unlocks_room_id=locked_room.id
     )
-    room.add_treasure(key)
-    return room
-
-@pytest.fixture
-def dungeon_map(locked_room, key_room):
-    """Create a test map with locked room and key."""
+    key_room.add_treasure(key)
     map_obj = Map()
     map_obj.add_room(locked_room)
     map_obj.add_room(key_room)
-    map_obj.connect_rooms(key_room, locked_room, Direction.NORTH)
-    return map_obj
+    map_obj.connect_rooms(key_room, locked_room, NORTH)
+    return SimpleNamespace(map=map_obj, locked_room=locked_room, key_room=key_room, key=key)
+
+@pytest.fixture(scope="module")
+def shared_map(theme):
+    """Create a key map shared by the tests that only read it."""
+    return _build_key_map(theme)
+
+@pytest.fixture
+def key_map(theme):
+    """Create a key map for a test that modifies it."""
+    return _build_key_map(theme)
 
-def test_get_locked_rooms(dungeon_map, locked_room):
+@pytest.fixture
+def extended_map(key_map):
+    """Extend a key map with a path: key_room -> locked_room -> end_room.
+    
+    Returns:
+        The key map namespace, with end_room added
+    """
+    key_map.end_room = Room(
+        description="End Room",
+        theme=key_map.key_room.theme
+    )
+    key_map.map.add_room(key_map.end_room)
+    key_map.map.connect_rooms(key_map.locked_room, key_map.end_room, EAST)
+    return key_map
+
+def test_get_locked_rooms(shared_map):
     """Test getting locked rooms."""
-    locked_rooms = dungeon_map.get_locked_rooms()
+    locked_rooms = shared_map.map.get_locked_rooms()
     assert len(locked_rooms) == 1
-    assert locked_rooms[0] == locked_room
+    assert locked_rooms[0] == shared_map.locked_room
 
-def test_find_keys_in_map(dungeon_map, locked_room):
+def test_find_keys_in_map(shared_map):
     """Test finding all keys in the map."""
-    keys = dungeon_map.find_keys_in_map()
+    keys = shared_map.map.find_keys_in_map()
     assert len(keys) == 1
-    assert keys[0].can_unlock(locked_room.id)
+    assert keys[0].can_unlock(shared_map.locked_room.id)
 
-def test_find_key_for_room(dungeon_map, locked_room, key_room):
-    """Test finding a specific key for a room."""
-    # Find existing key
-    result = dungeon_map.find_key_for_room(locked_room)
+def test_find_key_for_room(shared_map):
+    """Test finding an existing key for a room."""
+    result = shared_map.map.find_key_for_room(shared_map.locked_room)
     assert result is not None
     containing_room, key = result
-    assert containing_room == key_room
-    assert key.can_unlock(locked_room.id)
-    
-    # Try to find non-existent key
+    assert containing_room == shared_map.key_room
+    assert key.can_unlock(shared_map.locked_room.id)
+
+def test_find_key_for_room_without_key(key_map):
+    """Test that a locked room without a key has no key found."""
     other_room = Room(
         description="Other Room",
-        theme=key_room.theme,
+        theme=key_map.key_room.theme,
         is_locked=True
     )
-    dungeon_map.add_room(other_room)
-    assert dungeon_map.find_key_for_room(other_room) is None
+    key_map.map.add_room(other_room)
+    assert key_map.map.find_key_for_room(other_room) is None
 
-def test_is_path_accessible(dungeon_map, locked_room, key_room):
+def test_is_path_accessible(extended_map):
     """Test checking if a path is accessible with available keys."""
-    # Create a path: key_room -> locked_room -> end_room
-    end_room = Room(
-        description="End Room",
-        theme=key_room.theme
-    )
-    dungeon_map.add_room(end_room)
-    dungeon_map.connect_rooms(locked_room, end_room, Direction.EAST)
+    dungeon_map = extended_map.map
+    key_room, end_room = extended_map.key_room, extended_map.end_room
     
     # Try without key
     assert not dungeon_map.is_path_accessible(key_room, end_room)
@@ -96,15 +107,10 @@ def test_is_path_accessible(dungeon_map, locked_room, key_room):
     key = dungeon_map.find_keys_in_map()[0]
     assert dungeon_map.is_path_accessible(key_room, end_room, [key])
 
-def test_find_accessible_path(dungeon_map, locked_room, key_room):
+def test_find_accessible_path(extended_map):
     """Test finding an accessible path with required keys."""
-    # Create a path: key_room -> locked_room -> end_room
-    end_room = Room(
-        description="End Room",
-        theme=key_room.theme
-    )
-    dungeon_map.add_room(end_room)
-    dungeon_map.connect_rooms(locked_room, end_room, Direction.EAST)
+    dungeon_map = extended_map.map
+    key_room, end_room = extended_map.key_room, extended_map.end_room
     
     # Try without key
     assert dungeon_map.find_accessible_path(key_room, end_room) is None
@@ -118,14 +124,14 @@ def test_find_accessible_path(dungeon_map, locked_room, key_room):
     
     # Check first step
     room1, direction1, key1 = path[0]
-    assert room1 == locked_room
-    assert direction1 == Direction.NORTH
+    assert room1 == extended_map.locked_room
+    assert direction1 == NORTH
     assert key1 == key
     
     # Check second step
     room2, direction2, key2 = path[1]
     assert room2 == end_room
-    assert direction2 == Direction.EAST
+    assert direction2 == EAST
     assert key2 is None  # No key needed for unlocked room
 
 def test_complex_path_with_multiple_keys(theme):
@@ -159,10 +165,15 @@ def test_complex_path_with_multiple_keys(theme):
         map_obj.add_room(room)
     
     # Connect rooms in a circle
-    map_obj.connect_rooms(start_room, key_room1, Direction.NORTH)
-    map_obj.connect_rooms(key_room1, middle_room, Direction.EAST)
-    map_obj.connect_rooms(middle_room, key_room2, Direction.SOUTH)
-    map_obj.connect_rooms(key_room2, end_room, Direction.WEST)
+    map_obj.connect_rooms(start_room, key_room1, NORTH)
+    map_obj.connect_rooms(key_room1, middle_room, EAST)
+    map_obj.connect_rooms(middle_room, key_room2, SOUTH)
+    map_obj.connect_rooms(key_room2, end_room, WEST)
+    
+    # Cheap preconditions first: both rooms on the way are locked, and the
+    # first key alone cannot open the end room
+    assert set(map_obj.get_locked_rooms()) == {middle_room, end_room}
+    assert not key1.can_unlock(end_room.id)
     
     # Try to find path with no keys
     assert map_obj.find_accessible_path(start_room, end_room) is None
@@ -1,4 +1,5 @@
 """Tests for the Room model."""
+from contextlib import nullcontext
 from decimal import Decimal
 import pytest
 
@@ -9,43 +10,46 @@ from dungeon.models.room import Room
 from dungeon.models.theme import Theme
 from dungeon.models.trap import Trap
 
-@pytest.fixture
-def theme():
-    """Create a test theme."""
-    return Theme(
-        theme_name="Test Theme",
-        description="A test theme"
-    )
+# The theme is never mutated by the tests, so one instance is shared
+THEME = Theme(
+    theme_name="Test Theme",
+    description="A test theme"
+)
 
 @pytest.fixture
-def room(theme):
+def room():
     """Create a test room."""
     return Room(
+        name="Test Room",
         description="A test room",
-        theme=theme,
+        theme=THEME,
+        room_ref_id="test_room",
         is_dark=False
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def npc():
     """Create a test NPC."""
     return NPC(
         name="Test NPC",
         description="A test NPC",
-        health=Decimal("50.0"),
-        is_hostile=False
+        hit_points=Decimal("50.0"),
+        dexterity=10,
+        intelligence=10,
+        strength=10
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def item():
     """Create a test item."""
     return Item(
         name="Test Item",
         description="A test item",
+        detailed_description="A test item",
         value=10.0
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trap():
     """Create a test trap."""
     return Trap(
@@ -54,14 +58,14 @@ def trap():
         damage=15.0
     )
 
-def test_room_initialization(room, theme):
+def test_room_initialization(room):
     """Test room initialization."""
     assert room.description == "A test room"
-    assert room.theme == theme
+    assert room.theme == THEME
     assert room.is_dark is False
     assert room.visited is False
     assert room.npcs == []
-    assert room.treasures == []
+    assert room.room_items == []
     assert room.traps == []
 
 def test_room_attributes(room):
@@ -74,56 +78,36 @@ def test_room_attributes(room):
     room.visited = True
     assert room.visited is True
 
-def test_room_npcs(room, npc):
-    """Test room NPC operations."""
-    # Add NPC
-    room.add_npc(npc)
-    assert len(room.npcs) == 1
-    assert room.npcs[0] == npc
-    
-    # Remove NPC
-    room.remove_npc(npc)
-    assert len(room.npcs) == 0
-    
-    # Try to remove non-existent NPC
-    with pytest.raises(ValueError):
-        room.remove_npc(npc)
-
-def test_room_treasures(room, item):
-    """Test room treasure operations."""
-    # Add treasure
-    room.add_treasure(item)
-    assert len(room.treasures) == 1
-    assert room.treasures[0] == item
+# Room items are stored as {"item": item, "item_room_description": ...} entries,
+# and removing a missing item is a silent no-op
+@pytest.mark.parametrize("content, add, remove, collection, entry_key, missing_raises", [
+    ("npc", "add_npc", "remove_npc", "npcs", None, True),
+    ("item", "add_item", "remove_item", "room_items", "item", False),
+    ("trap", "add_trap", "remove_trap", "traps", None, True),
+])
+def test_room_collection(room, request, content, add, remove, collection, entry_key, missing_raises):
+    """Test adding and removing room NPCs, items, and traps."""
+    thing = request.getfixturevalue(content)
     
-    # Remove treasure
-    room.remove_treasure(item)
-    assert len(room.treasures) == 0
-    
-    # Try to remove non-existent treasure
-    with pytest.raises(ValueError):
-        room.remove_treasure(item)
-
-def test_room_traps(room, trap):
-    """Test room trap operations."""
-    # Add trap
-    room.add_trap(trap)
-    assert len(room.traps) == 1
-    assert room.traps[0] == trap
+    # Add to the room
+    getattr(room, add)(thing)
+    entries = getattr(room, collection)
+    assert len(entries) == 1
+    assert (entries[0] if entry_key is None else entries[0][entry_key]) == thing
     
-    # Remove trap
-    room.remove_trap(trap)
-    assert len(room.traps) == 0
+    # Remove from the room
+    getattr(room, remove)(thing)
+    assert len(getattr(room, collection)) == 0
     
-    # Try to remove non-existent trap
-    with pytest.raises(ValueError):
-        room.remove_trap(trap)
+    # Try to remove something that is not in the room
+    with pytest.raises(ValueError) if missing_raises else nullcontext():
+        getattr(room, remove)(thing)
 
-def test_room_to_dict(room, theme, npc, item, trap):
+def test_room_to_dict(room, npc, item, trap):
     """Test room to_dict method."""
     # Add content to room
     room.add_npc(npc)
-    room.add_treasure(item)
+    room.add_item(item)
     room.add_trap(trap)
     
     # Convert to dict
@@ -140,5 +124,5 @@ def test_room_to_dict(room, theme, npc, item, trap):
     
     # Check collections
     assert len(room_dict["npcs"]) == 1
-    assert len(room_dict["treasures"]) == 1
+    assert len(room_dict["room_items"]) == 1
     assert len(room_dict["traps"]) == 1 
\ No newline at end of file
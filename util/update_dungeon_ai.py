@@ -18,22 +18,33 @@ import os
 import sys
 import json
 import argparse
+import functools
+import hashlib
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
+
 # Add the src directory to the Python path so we can import the dungeon modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.dungeon.models.ai_generator import AIGenerator
 from src.dungeon.models.room import Room
 from src.dungeon.models.theme import Theme
 from src.dungeon.models.room_type import RoomType
 
+# Room descriptions are network-bound, so several requests can be in flight at once
+AI_MAX_WORKERS = 8
+
 
 def load_dungeon_json(file_path):
     """Load a dungeon JSON file."""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        # Hand the raw bytes to the parser; both decoders take UTF-8 bytes directly
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         print(f"Error loading dungeon JSON file: {e}")
         sys.exit(1)
@@ -41,28 +52,70 @@ def load_dungeon_json(file_path):
 
 def save_dungeon_json(dungeon_data, file_path):
     """Save a dungeon JSON file."""
+    # Write to a sibling temp file and swap it in, so a failed save never leaves a half-written file
+    file_path = Path(file_path)
+    tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
     try:
-        with open(file_path, 'w') as f:
-            json.dump(dungeon_data, f, indent=2)
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(dungeon_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(dungeon_data, f, indent=2)
+        os.replace(tmp_path, file_path)
         print(f"Saved updated dungeon to {file_path}")
     except Exception as e:
         print(f"Error saving dungeon JSON file: {e}")
         sys.exit(1)
 
 
-def create_room_object(room_data, themes):
+@functools.lru_cache(maxsize=1)
+def get_ai_generator():
+    """Return the shared AIGenerator, creating it on first use."""
+    # Imported here so --help and argument errors don't pay for loading the Groq client
+    from src.dungeon.models.ai_generator import AIGenerator
+    return AIGenerator()
+
+
+def build_theme_lookup(themes):
+    """Build a Theme object for each theme entry, keyed by theme name."""
+    theme_by_name = {}
+    for t in themes:
+        # The first entry wins when a name repeats, as with a linear scan
+        if t['name'] not in theme_by_name:
+            theme_by_name[t['name']] = Theme(t['name'], t['description'], t['theme_type'], t['music'])
+    return theme_by_name
+
+
+@functools.lru_cache(maxsize=None)
+def _room_type_for(room_type_name):
+    """Return the shared RoomType object for a room type name."""
+    return RoomType(
+        name=room_type_name,
+        description=f"A {room_type_name} room"
+    )
+
+
+def room_input_hash(room_data):
+    """Hash the room fields that feed the AI prompt, to detect rooms that need regenerating."""
+    inputs = {
+        'description': room_data.get('description', ''),
+        'theme': room_data.get('theme', ''),
+        'room_type': room_data.get('room_type', ''),
+        'is_dark': room_data.get('is_dark', False),
+        'is_locked': room_data.get('is_locked', False),
+    }
+    return hashlib.blake2b(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def create_room_object(room_data, theme_by_name):
     """Create a Room object from room data."""
     # Find the theme object
-    theme_name = room_data.get('theme', '')
-    theme_data = next((t for t in themes if t['name'] == theme_name), None)
-    theme = Theme(theme_data['name'], theme_data['description'], theme_data['theme_type'], theme_data['music']) if theme_data else None
+    theme = theme_by_name.get(room_data.get('theme', ''))
     
-    # Create a RoomType object with both name and description
+    # Look up the RoomType object with both name and description
     room_type_name = room_data.get('room_type', '')
-    room_type = RoomType(
-        name=room_type_name,
-        description=f"A {room_type_name} room"
-    ) if room_type_name else None
+    room_type = _room_type_for(room_type_name) if room_type_name else None
     
     # Create a Room object
     room = Room(
@@ -83,33 +136,48 @@ def update_dungeon_ai(dungeon_file):
     # Load the dungeon JSON file
     dungeon_data = load_dungeon_json(dungeon_file)
     
-    # Initialize the AI generator
-    ai_generator = AIGenerator()
+    # Get the AI generator
+    ai_generator = get_ai_generator()
     
-    # Get the themes
-    themes = dungeon_data.get('themes', [])
+    # Build the themes once so rooms sharing a theme share the object
+    theme_by_name = build_theme_lookup(dungeon_data.get('themes', []))
     
-    # Update each room with AI-generated descriptions
+    # Collect the rooms that need a new description
+    pending = []
+    pairs = []
     for room in dungeon_data['map']['rooms']:
         room_ref_id = room.get('room_ref_id', '')
         if not room_ref_id:
             print(f"Warning: Room {room.get('name', 'Unknown')} has no room_ref_id, skipping")
             continue
         
-        # Create a Room object for the AI generator
-        room_obj = create_room_object(room, themes)
+        # Skip rooms whose description was already generated from the same inputs
+        input_hash = room_input_hash(room)
+        if room.get('ai_description') and room.get('ai_input_hash') == input_hash:
+            continue
         
-        # Generate an AI description
+        # Create a Room object for the AI generator
+        room_obj = create_room_object(room, theme_by_name)
         print(f"Generating AI description for room: {room_obj.name} ({room_ref_id})")
-        ai_description = ai_generator.room_description_generate(room_ref_id, room_obj)
-        
-        # Update the room data
+        pending.append((room, input_hash))
+        pairs.append((room_ref_id, room_obj))
+    
+    # Generate the AI descriptions in one batch
+    ai_descriptions = ai_generator.room_description_generate_batch(pairs, max_workers=AI_MAX_WORKERS)
+    
+    # Update the room data
+    for (room, input_hash), ai_description in zip(pending, ai_descriptions):
         room['ai_description'] = ai_description
         room['ai_update'] = True
+        # Leave fallback descriptions unhashed so the next run retries them
+        if ai_description != ai_generator.ROOM_FALLBACK_DESCRIPTION:
+            room['ai_input_hash'] = input_hash
+        else:
+            room.pop('ai_input_hash', None)
     
     # Create the output file path
-    file_path = Path(dungeon_file)
-    output_file = file_path.parent / f"{file_path.stem}_ai{file_path.suffix}"
+    dungeon_file = Path(dungeon_file)
+    output_file = dungeon_file.parent / f"{dungeon_file.stem}_ai{dungeon_file.suffix}"
     
     # Save the updated dungeon data
     save_dungeon_json(dungeon_data, output_file)
@@ -124,12 +192,13 @@ def main():
     args = parser.parse_args()
     
     # Check if the file exists
-    if not os.path.exists(args.dungeon_file):
-        print(f"Error: File {args.dungeon_file} does not exist")
+    dungeon_file = Path(args.dungeon_file)
+    if not dungeon_file.is_file():
+        print(f"Error: File {dungeon_file} does not exist")
         sys.exit(1)
     
     # Update the dungeon AI descriptions
-    output_file = update_dungeon_ai(args.dungeon_file)
+    output_file = update_dungeon_ai(dungeon_file)
     print(f"Successfully updated dungeon AI descriptions to {output_file}")
 
 